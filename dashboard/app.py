@@ -670,7 +670,7 @@ class DashboardApp:
                         st.write(f"**Savings %:** {deal['savings_percentage']:.1f}%")
                         if st.button(f"Compare {deal['product_name']}", key=f"compare_{i}"):
                             # Trigger comparison for this product
-                            comparison = self.pricing_engine.compare_prices(deal['product_id'])
+                            comparison = self.pricing_engine.compare_prices(deal['product_id'], include_trends=False)
                             if comparison:
                                 st.success(f"✅ {comparison.recommendation}")
         else:
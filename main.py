@@ -105,8 +105,7 @@ class AIRetailIntelligencePlatform:
                 
                 # Update pricing engine with price history
                 try:
-                    prices = data['close'].tolist()
-                    self.pricing_engine.update_price_history(symbol.upper(), prices)
+                    self.pricing_engine.update_price_history(symbol.upper(), data['close'].to_numpy(copy=False))
                     print(f"    ✓ Updated pricing engine for {symbol}")
                 except Exception as e:
                     print(f"    Warning: Could not update pricing engine for {symbol}: {str(e)}")
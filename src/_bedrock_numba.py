@@ -0,0 +1,69 @@
+"""Numba-compiled numeric kernels for the Bedrock forecasting framework.
+
+Kept in a separate module so the JIT import and compilation cost is paid once
+and the kernels stay at module scope, as Numba requires. Without Numba the
+kernels run as plain NumPy-backed Python functions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# Trend codes returned by trend_code()
+TREND_INSUFFICIENT = 0
+TREND_BULLISH = 1
+TREND_BEARISH = 2
+TREND_NEUTRAL = 3
+
+
+@njit(cache=True)
+def trend_code(predictions):
+    """Classify a prediction path by its first and last values."""
+    n = predictions.shape[0]
+    if n < 2:
+        return TREND_INSUFFICIENT
+    
+    first = predictions[0]
+    last = predictions[n - 1]
+    if last > first * 1.05:
+        return TREND_BULLISH
+    elif last < first * 0.95:
+        return TREND_BEARISH
+    return TREND_NEUTRAL
+
+
+@njit(cache=True, parallel=True)
+def trend_codes(first, last, counts):
+    """Classify many prediction paths at once from their first/last values and lengths."""
+    n = first.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        if counts[i] < 2:
+            out[i] = TREND_INSUFFICIENT
+        elif last[i] > first[i] * 1.05:
+            out[i] = TREND_BULLISH
+        elif last[i] < first[i] * 0.95:
+            out[i] = TREND_BEARISH
+        else:
+            out[i] = TREND_NEUTRAL
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def weighted_average(a, b, wa, wb, out):
+    """Write the element-wise weighted average of two prediction arrays into out."""
+    for i in range(a.shape[0]):
+        out[i] = wa * a[i] + wb * b[i]
+    return out
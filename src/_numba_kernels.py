@@ -0,0 +1,93 @@
+"""Numba-compiled technical indicator kernel for price data preprocessing.
+
+The kernel makes a single pass over the input, adding the incoming value to
+each rolling window and removing the departing one, and follows pandas'
+rolling semantics: NaNs are skipped and a window needs ``window`` valid
+observations to produce a value.
+Without Numba the kernel runs as a plain Python function.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def compute_indicators(close, high, low, short_window=7, long_window=30):
+    """Compute all technical indicators in one sweep over close/high/low.
+    
+    Returns (ma_short, ma_long, volatility, price_change, daily_range,
+    daily_range_pct), matching the pandas rolling/pct_change equivalents.
+    """
+    n = close.shape[0]
+    ma_short = np.empty(n)
+    ma_long = np.empty(n)
+    volatility = np.empty(n)
+    price_change = np.empty(n)
+    daily_range = np.empty(n)
+    daily_range_pct = np.empty(n)
+    
+    sum_short = 0.0
+    nobs_short = 0
+    sum_long = 0.0
+    mean_long = 0.0
+    ssqdm_long = 0.0
+    nobs_long = 0
+    
+    for i in range(n):
+        val = close[i]
+        valid = not np.isnan(val)
+        
+        # Incoming value
+        if valid:
+            sum_short += val
+            nobs_short += 1
+            sum_long += val
+            nobs_long += 1
+            delta = val - mean_long
+            mean_long += delta / nobs_long
+            ssqdm_long += ((nobs_long - 1) * delta * delta) / nobs_long
+        
+        # Values leaving each window
+        if i >= short_window:
+            old = close[i - short_window]
+            if not np.isnan(old):
+                sum_short -= old
+                nobs_short -= 1
+        
+        if i >= long_window:
+            old = close[i - long_window]
+            if not np.isnan(old):
+                sum_long -= old
+                nobs_long -= 1
+                if nobs_long > 0:
+                    delta = old - mean_long
+                    mean_long -= delta / nobs_long
+                    ssqdm_long -= ((nobs_long + 1) * delta * delta) / nobs_long
+                else:
+                    mean_long = 0.0
+                    ssqdm_long = 0.0
+        
+        ma_short[i] = sum_short / nobs_short if nobs_short >= short_window else np.nan
+        ma_long[i] = sum_long / nobs_long if nobs_long >= long_window else np.nan
+        if nobs_long >= long_window and nobs_long > 1:
+            volatility[i] = np.sqrt(max(ssqdm_long / (nobs_long - 1), 0.0))
+        else:
+            volatility[i] = np.nan
+        
+        price_change[i] = val / close[i - 1] - 1 if i > 0 else np.nan
+        
+        daily_range[i] = high[i] - low[i]
+        daily_range_pct[i] = daily_range[i] / val
+    
+    return ma_short, ma_long, volatility, price_change, daily_range, daily_range_pct
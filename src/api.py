@@ -2,15 +2,25 @@
 
 import os
 import json
+import asyncio
+import cProfile
+import functools
+import hashlib
+import io
+import pstats
+import time
+from email.utils import formatdate
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable
 from contextlib import asynccontextmanager
 
 try:
-    from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, BackgroundTasks
+    from fastapi import APIRouter, FastAPI, HTTPException, Depends, UploadFile, File, BackgroundTasks, Request
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse
-    from pydantic import BaseModel, Field
+    from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+    from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+    import orjson
     import uvicorn
     FASTAPI_AVAILABLE = True
 except ImportError:
@@ -21,6 +31,13 @@ except ImportError:
     class Field:
         def __init__(self, *args, **kwargs):
             pass
+    ConfigDict = dict
+
+try:
+    from prometheus_fastapi_instrumentator import Instrumentator
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
 
 from src.data_loader import DataLoader
 from src.forecasting_model import PriceForecastingEngine
@@ -65,6 +82,8 @@ class DocumentUpload(BaseModel):
 # Response models
 class APIResponse(BaseModel):
     """Standard API response model."""
+    model_config = ConfigDict(defer_build=False)
+    
     success: bool
     message: str
     data: Optional[Any] = None
@@ -73,6 +92,8 @@ class APIResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Error response model."""
+    model_config = ConfigDict(defer_build=False)
+    
     success: bool = False
     error_code: str
     error_message: str
@@ -80,6 +101,134 @@ class ErrorResponse(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+if FASTAPI_AVAILABLE:
+    _RESP_ADAPTER = TypeAdapter(APIResponse)
+
+
+def ok(message: str, data: Any = None, etag: Optional[str] = None) -> "ORJSONResponse":
+    """Build a successful response, serialized once by pydantic-core and orjson.
+    
+    When ``etag`` is given it is sent along with the data's Last-Modified time.
+    """
+    payload = _RESP_ADAPTER.dump_python(
+        APIResponse(success=True, message=message, data=data), mode='json'
+    )
+    response = ORJSONResponse(content=payload)
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = data_last_modified
+    return response
+
+
+def payload_etag(data: Any) -> str:
+    """Strong ETag derived from the response data."""
+    digest = hashlib.blake2b(orjson.dumps(data, default=str), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request: "Request", etag: str) -> Optional["Response"]:
+    """Return a 304 response if the client already holds ``etag``.
+    
+    Only a single strong entity tag is honoured: weak (``W/``) validators and
+    lists of tags always get the full response, on every endpoint.
+    """
+    client_etag = request.headers.get("if-none-match", "").strip()
+    if client_etag.startswith("W/") or "," in client_etag:
+        return None
+    if client_etag == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Last-Modified": data_last_modified})
+    return None
+
+
+def ok_stream(message: str, data: Dict[str, Any]) -> "StreamingResponse":
+    """Stream a successful response, serializing ``data`` one top-level key at a time.
+    
+    The envelope matches ``ok()``; only the encoding is incremental.
+    """
+    async def body():
+        yield b'{"success":true,"message":' + orjson.dumps(message) + b',"data":{'
+        for index, (key, value) in enumerate(data.items()):
+            yield (b',' if index else b'') + orjson.dumps(key) + b':' + orjson.dumps(value)
+        yield b'},"timestamp":' + orjson.dumps(datetime.now().isoformat()) + b'}'
+    
+    return StreamingResponse(body(), media_type="application/json")
+
+
+class AsyncBatcher:
+    """Coalesce concurrent single-item requests into one batched backend call.
+
+    Items submitted within ``max_wait`` seconds of each other (up to
+    ``max_batch_size``) are handed to ``batch_fn`` together. ``batch_fn``
+    must return one result per item, in order; exception instances in the
+    result list are raised to the matching caller. When ``executor`` is set
+    the batch runs there instead of on the event loop.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]],
+                 max_batch_size: int = 32, max_wait: float = 0.005,
+                 executor: Optional[Executor] = None):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> asyncio.Future:
+        """Queue an item and return a future resolved with its result."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return future
+
+    async def _run(self):
+        """Drain the queue in batches until cancelled."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            items = [item for item, _ in batch]
+            try:
+                if self.executor is not None:
+                    results = await loop.run_in_executor(self.executor, self.batch_fn, items)
+                else:
+                    results = self.batch_fn(items)
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def close(self):
+        """Stop the background worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+
 # Global instances
 data_loader = None
 forecasting_engine = None
@@ -87,6 +236,149 @@ pricing_engine = None
 document_parser = None
 market_copilot = None
 competitive_pricing_engine = None
+copilot_batcher = None
+forecast_batcher = None
+cpu_pool = None
+
+# Cached status payloads
+DATA_SOURCES = {
+    'gold': ('gold_prices.csv', 'load_gold_prices'),
+    'silver': ('silver_prices.csv', 'load_silver_prices'),
+    'etf': ('etf_prices.csv', 'load_etf_prices'),
+}
+DATA_FILES = tuple(file for file, _ in DATA_SOURCES.values())
+STATUS_CACHE_TTL = 30.0  # seconds
+system_info_static = None
+data_files_present = None
+_status_cache: Dict[str, Any] = {}
+
+# Hash of the data files as of the last (re)load; scopes ETags of data-derived
+# payloads and is the same across restarts and workers while the files are unchanged
+data_fingerprint = ""
+data_last_modified = formatdate(usegmt=True)
+
+# Loaded DataFrames keyed by symbol, with the source file mtime they were read at
+data_frames: Dict[str, Any] = {}
+data_frame_mtimes: Dict[str, float] = {}
+
+
+def _data_fingerprint(data_dir: str) -> str:
+    """Hash the app version and each data file's size and mtime."""
+    digest = hashlib.blake2b(settings.app_version.encode(), digest_size=8)
+    for file in DATA_FILES:
+        try:
+            stat = os.stat(os.path.join(data_dir, file))
+            digest.update(f"{file}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        except OSError:
+            digest.update(f"{file}:missing;".encode())
+    return digest.hexdigest()
+
+
+def _build_status_cache():
+    """Compute the parts of the status payloads that only change on startup/reload."""
+    global system_info_static, data_files_present, data_fingerprint, data_last_modified
+    
+    data_last_modified = formatdate(usegmt=True)
+    
+    system_info_static = {
+        "platform": "AI Retail Intelligence Platform",
+        "version": settings.app_version,
+        "components": {
+            "data_loader": data_loader is not None,
+            "forecasting_engine": forecasting_engine is not None,
+            "pricing_engine": pricing_engine is not None,
+            "document_parser": document_parser is not None,
+            "market_copilot": market_copilot is not None,
+            "competitive_pricing_engine": competitive_pricing_engine is not None
+        },
+        "configuration": {
+            "api_prefix": settings.api_prefix,
+            "data_directory": settings.data_dir,
+            "model_directory": settings.model_dir,
+            "default_forecast_horizon": settings.default_forecast_horizon
+        }
+    }
+    
+    data_dir = data_loader.data_dir if data_loader else settings.data_dir
+    data_files_present = {
+        file: os.path.exists(os.path.join(data_dir, file)) for file in DATA_FILES
+    }
+    data_fingerprint = _data_fingerprint(data_dir)
+    
+    _status_cache.clear()
+
+
+def _cache_frames(all_data: Dict[str, Any]):
+    """Remember loaded DataFrames and the mtime of the files they came from."""
+    for symbol, data in all_data.items():
+        file_name = DATA_SOURCES[symbol][0]
+        try:
+            data_frame_mtimes[symbol] = os.stat(os.path.join(data_loader.data_dir, file_name)).st_mtime
+        except OSError:
+            continue
+        data_frames[symbol] = data
+
+
+def _get_frame(symbol: str):
+    """Return the cached DataFrame for ``symbol``, reloading it if its file changed."""
+    file_name, loader_name = DATA_SOURCES[symbol]
+    file_path = os.path.join(data_loader.data_dir, file_name)
+    
+    try:
+        mtime = os.stat(file_path).st_mtime
+    except OSError:
+        raise DataLoadingError(f"Price file not found: {file_path}")
+    
+    if symbol not in data_frames or data_frame_mtimes.get(symbol) != mtime:
+        data_frames[symbol] = getattr(data_loader, loader_name)(file_path)
+        data_frame_mtimes[symbol] = mtime
+    
+    return data_frames[symbol]
+
+
+async def run_cpu(fn: Callable, *args, **kwargs):
+    """Run a CPU-bound callable in the process pool, or inline if no pool is running.
+    
+    Arguments are pickled to the worker, so engine state is read-only there.
+    """
+    if cpu_pool is None:
+        return fn(*args, **kwargs)
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(cpu_pool, functools.partial(fn, *args, **kwargs))
+
+
+# DocumentParser owned by each pool worker, built once by _init_cpu_worker
+_worker_document_parser = None
+
+
+def _init_cpu_worker():
+    """Build per-process state once, when a pool worker starts."""
+    global _worker_document_parser
+    _worker_document_parser = DocumentParser()
+
+
+def _parse_document_in_worker(text_content: str, document_id: Optional[str]):
+    """Parse a document with the worker's DocumentParser."""
+    if _worker_document_parser is None:
+        _init_cpu_worker()
+    
+    analysis = _worker_document_parser.parse_document(text_content=text_content, document_id=document_id)
+    # The caller stores the result; the long-lived worker keeps no history of its own
+    _worker_document_parser.processed_documents.pop(analysis.document_id, None)
+    return analysis
+
+
+def _cached_payload(key: str, builder: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the cached payload for ``key``, rebuilding it once the TTL expires."""
+    now = time.monotonic()
+    entry = _status_cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+    
+    payload = builder()
+    _status_cache[key] = (now + STATUS_CACHE_TTL, payload)
+    return payload
 
 
 @asynccontextmanager
@@ -94,6 +386,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     global data_loader, forecasting_engine, pricing_engine, document_parser, market_copilot, competitive_pricing_engine
+    global copilot_batcher, forecast_batcher, cpu_pool
     
     try:
         # Initialize components
@@ -104,6 +397,13 @@ async def lifespan(app: FastAPI):
         market_copilot = MarketCopilot()
         competitive_pricing_engine = CompetitivePricingEngine()
         
+        # CPU-bound endpoints run in worker processes to avoid the GIL
+        cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_cpu_worker)
+        
+        # Coalesce concurrent copilot/forecast requests into batched calls
+        copilot_batcher = AsyncBatcher(market_copilot.process_queries_batch)
+        forecast_batcher = AsyncBatcher(forecasting_engine.predict_prices_batch, executor=cpu_pool)
+        
         # Load initial data
         try:
             all_data = data_loader.load_all_data()
@@ -118,24 +418,27 @@ async def lifespan(app: FastAPI):
                         print(f"Warning: Could not train model for {symbol}: {str(e)}")
                     
                     # Update pricing engine with price history
-                    prices = data['close'].tolist()
+                    prices = data['close'].to_numpy(copy=False)
                     pricing_engine.update_price_history(symbol.upper(), prices)
                     
                     # Update market copilot context
                     price_data = {
                         symbol.upper(): {
-                            'current_price': prices[-1],
+                            'current_price': float(prices[-1]),
                             'trend': 'stable',  # Simplified
                             'data_points': len(prices)
                         }
                     }
                     market_copilot.update_context({'price_data': price_data})
             
+            _cache_frames(all_data)
             print(f"Successfully initialized with data for {len(all_data)} assets")
             
         except Exception as e:
             print(f"Warning: Could not load initial data: {str(e)}")
         
+        _build_status_cache()
+        
         yield
         
     except Exception as e:
@@ -143,6 +446,13 @@ async def lifespan(app: FastAPI):
         yield
     
     # Shutdown
+    for batcher in (copilot_batcher, forecast_batcher):
+        if batcher:
+            await batcher.close()
+    
+    if cpu_pool:
+        cpu_pool.shutdown(wait=False, cancel_futures=True)
+    
     print("Shutting down AI Retail Intelligence Platform")
 
 
@@ -163,43 +473,90 @@ if FASTAPI_AVAILABLE:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    
+    # Per-route latency histograms at /metrics when the instrumentator is installed
+    if PROMETHEUS_AVAILABLE:
+        Instrumentator().instrument(app).expose(app, endpoint="/metrics")
+    
+    @app.middleware("http")
+    async def add_process_time_header(request: Request, call_next):
+        """Report server-side handling time on every response."""
+        start = time.perf_counter()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = f"{time.perf_counter() - start:.6f}"
+        return response
 else:
     app = None
 
 
-def handle_exceptions(func):
-    """Decorator to handle exceptions and return appropriate responses."""
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except DataLoadingError as e:
-            raise HTTPException(status_code=400, detail=f"Data loading error: {str(e)}")
-        except ModelTrainingError as e:
-            raise HTTPException(status_code=400, detail=f"Model training error: {str(e)}")
-        except ForecastingError as e:
-            raise HTTPException(status_code=400, detail=f"Forecasting error: {str(e)}")
-        except PricingEngineError as e:
-            raise HTTPException(status_code=400, detail=f"Pricing engine error: {str(e)}")
-        except DocumentParsingError as e:
-            raise HTTPException(status_code=400, detail=f"Document parsing error: {str(e)}")
-        except LLMServiceError as e:
-            raise HTTPException(status_code=500, detail=f"LLM service error: {str(e)}")
-        except AIRetailIntelligenceError as e:
-            raise HTTPException(status_code=500, detail=f"Platform error: {str(e)}")
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+# Exception class -> (status code, detail prefix). Starlette resolves handlers
+# along the exception's MRO, so subclasses win over AIRetailIntelligenceError.
+EXCEPTION_RESPONSES = {
+    DataLoadingError: (400, "Data loading error"),
+    ModelTrainingError: (400, "Model training error"),
+    ForecastingError: (400, "Forecasting error"),
+    PricingEngineError: (400, "Pricing engine error"),
+    DocumentParsingError: (400, "Document parsing error"),
+    LLMServiceError: (500, "LLM service error"),
+    AIRetailIntelligenceError: (500, "Platform error"),
+    Exception: (500, "Internal server error"),
+}
+
+
+def _make_exception_handler(status_code: int, prefix: str):
+    """Create a handler that renders an exception as an HTTP error response."""
+    async def handler(request: Request, exc: Exception) -> JSONResponse:
+        return JSONResponse(status_code=status_code, content={"detail": f"{prefix}: {str(exc)}"})
     
-    return wrapper
+    return handler
+
+
+if FASTAPI_AVAILABLE:
+    for exc_class, (status_code, prefix) in EXCEPTION_RESPONSES.items():
+        app.add_exception_handler(exc_class, _make_exception_handler(status_code, prefix))
 
 
 if FASTAPI_AVAILABLE:
     
+    # Ad-hoc profiling of the event loop thread, for finding hotspots
+    @app.get("/debug/profile")
+    async def profile_event_loop(request: Request, seconds: float = 5.0, limit: int = 30):
+        """Profile request handling for a few seconds and return the top functions."""
+        if not settings.admin_token or request.headers.get("x-admin-token") != settings.admin_token:
+            raise HTTPException(status_code=403, detail="Admin token required")
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(min(max(seconds, 0.1), 60.0))
+        finally:
+            profiler.disable()
+        
+        stats = pstats.Stats(profiler, stream=io.StringIO()).sort_stats("cumulative")
+        functions = []
+        for (file_name, line, function), (_, calls, total_time, cumulative_time, _) in stats.stats.items():
+            functions.append({
+                "function": f"{file_name}:{line}({function})",
+                "calls": calls,
+                "total_time": total_time,
+                "cumulative_time": cumulative_time
+            })
+        functions.sort(key=lambda f: f["cumulative_time"], reverse=True)
+        
+        return ok(
+            message=f"Profiled {seconds:.1f}s of request handling",
+            data={"functions": functions[:limit]}
+        )
+    
+    
+    # All versioned endpoints live on one router mounted under the API prefix
+    router = APIRouter(prefix=settings.api_prefix)
+    
     # Health check endpoint
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return APIResponse(
-            success=True,
+        return ok(
             message="AI Retail Intelligence Platform is running",
             data={
                 "status": "healthy",
@@ -210,8 +567,7 @@ if FASTAPI_AVAILABLE:
     
     
     # Price Forecasting Endpoints
-    @app.post(f"{settings.api_prefix}/forecast/{{asset}}")
-    @handle_exceptions
+    @router.post("/forecast/{asset}")
     async def forecast_asset_price(asset: str, request: ForecastRequest):
         """Generate price forecast for specified asset."""
         if not forecasting_engine:
@@ -222,38 +578,38 @@ if FASTAPI_AVAILABLE:
         if asset.lower() not in valid_assets:
             raise HTTPException(status_code=400, detail=f"Invalid asset. Must be one of: {valid_assets}")
         
-        # Generate forecast
-        result = forecasting_engine.predict_prices(
-            symbol=asset.upper(),
-            horizon=request.horizon,
-            model_name=request.model_name
-        )
+        # Generate forecast (batched with concurrent requests)
+        future = await forecast_batcher.submit((asset.upper(), request.horizon, request.model_name))
+        result = await future
         
-        return APIResponse(
-            success=True,
+        return ok(
             message=f"Forecast generated for {asset}",
             data=result.to_dict()
         )
     
     
-    @app.get(f"{settings.api_prefix}/forecast/models")
-    async def get_available_models():
+    @router.get("/forecast/models")
+    async def get_available_models(request: Request):
         """Get list of available forecasting models."""
         if not forecasting_engine:
             raise HTTPException(status_code=503, detail="Forecasting engine not available")
         
         model_info = forecasting_engine.get_model_info()
         
-        return APIResponse(
-            success=True,
+        etag = payload_etag(model_info)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        
+        return ok(
             message="Available models retrieved",
-            data=model_info
+            data=model_info,
+            etag=etag
         )
     
     
     # Pricing Recommendation Endpoints
-    @app.post(f"{settings.api_prefix}/pricing/recommend")
-    @handle_exceptions
+    @router.post("/pricing/recommend")
     async def get_pricing_recommendation(request: PricingRequest):
         """Get pricing recommendation for an asset."""
         if not pricing_engine:
@@ -265,15 +621,13 @@ if FASTAPI_AVAILABLE:
             symbol=request.symbol.upper()
         )
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Pricing recommendation generated",
             data=recommendation.to_dict()
         )
     
     
-    @app.get(f"{settings.api_prefix}/pricing/analysis/{{symbol}}")
-    @handle_exceptions
+    @router.get("/pricing/analysis/{symbol}")
     async def get_pricing_analysis(symbol: str):
         """Get detailed pricing analysis for a symbol."""
         if not pricing_engine:
@@ -281,51 +635,51 @@ if FASTAPI_AVAILABLE:
         
         insights = pricing_engine.get_pricing_insights(symbol.upper())
         
-        return APIResponse(
-            success=True,
+        return ok(
             message=f"Pricing analysis for {symbol}",
             data=insights
         )
     
     
-    @app.get(f"{settings.api_prefix}/pricing/report")
-    @handle_exceptions
-    async def generate_pricing_report(strategy_type: str = "balanced"):
+    @router.get("/pricing/report")
+    async def generate_pricing_report(request: Request, strategy_type: str = "balanced"):
         """Generate comprehensive pricing report."""
         if not pricing_engine:
             raise HTTPException(status_code=503, detail="Pricing engine not available")
         
-        report = pricing_engine.generate_pricing_report(strategy_type=strategy_type)
+        # The report only changes when price data is reloaded, so the ETag
+        # is checked before doing any work
+        etag = payload_etag(["report", data_fingerprint, strategy_type])
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
         
-        return APIResponse(
-            success=True,
+        report = await run_cpu(pricing_engine.generate_pricing_report, strategy_type=strategy_type)
+        
+        return ok(
             message="Pricing report generated",
-            data=report
+            data=report,
+            etag=etag
         )
     
     
     # Document Processing Endpoints
-    @app.post(f"{settings.api_prefix}/documents/parse")
-    @handle_exceptions
+    @router.post("/documents/parse")
     async def parse_document(request: DocumentUpload):
         """Parse and analyze a document."""
         if not document_parser:
             raise HTTPException(status_code=503, detail="Document parser not available")
         
-        analysis = document_parser.parse_document(
-            text_content=request.content,
-            document_id=request.document_id
-        )
+        analysis = await run_cpu(_parse_document_in_worker, request.content, request.document_id)
+        document_parser.store_processed_document(analysis)
         
-        return APIResponse(
-            success=True,
+        return ok_stream(
             message="Document parsed successfully",
             data=analysis.to_dict()
         )
     
     
-    @app.post(f"{settings.api_prefix}/documents/upload")
-    @handle_exceptions
+    @router.post("/documents/upload")
     async def upload_document(file: UploadFile = File(...)):
         """Upload and parse a document file."""
         if not document_parser:
@@ -335,19 +689,16 @@ if FASTAPI_AVAILABLE:
         content = await file.read()
         text_content = content.decode('utf-8')
         
-        analysis = document_parser.parse_document(
-            text_content=text_content,
-            document_id=file.filename
-        )
+        analysis = await run_cpu(_parse_document_in_worker, text_content, file.filename)
+        document_parser.store_processed_document(analysis)
         
-        return APIResponse(
-            success=True,
+        return ok_stream(
             message=f"Document {file.filename} processed successfully",
             data=analysis.to_dict()
         )
     
     
-    @app.get(f"{settings.api_prefix}/documents/{{document_id}}")
+    @router.get("/documents/{document_id}")
     async def get_document_analysis(document_id: str):
         """Get previously processed document analysis."""
         if not document_parser:
@@ -358,25 +709,23 @@ if FASTAPI_AVAILABLE:
         if not analysis:
             raise HTTPException(status_code=404, detail="Document not found")
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Document analysis retrieved",
             data=analysis.to_dict()
         )
     
     
     # Market Copilot Endpoints
-    @app.post(f"{settings.api_prefix}/copilot/query")
-    @handle_exceptions
+    @router.post("/copilot/query")
     async def query_market_copilot(request: CopilotQuery):
         """Query the market copilot AI assistant."""
         if not market_copilot:
             raise HTTPException(status_code=503, detail="Market copilot not available")
         
-        response = market_copilot.process_query(request.query, request.context)
+        future = await copilot_batcher.submit((request.query, request.context))
+        response = await future
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Query processed",
             data={
                 "query": request.query,
@@ -386,8 +735,7 @@ if FASTAPI_AVAILABLE:
         )
     
     
-    @app.get(f"{settings.api_prefix}/copilot/insights")
-    @handle_exceptions
+    @router.get("/copilot/insights")
     async def get_copilot_insights(query: str):
         """Get detailed insights for a query."""
         if not market_copilot:
@@ -395,14 +743,13 @@ if FASTAPI_AVAILABLE:
         
         insights = market_copilot.get_financial_insights(query)
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Insights generated",
             data=insights
         )
     
     
-    @app.get(f"{settings.api_prefix}/copilot/history")
+    @router.get("/copilot/history")
     async def get_conversation_history():
         """Get conversation history."""
         if not market_copilot:
@@ -410,14 +757,13 @@ if FASTAPI_AVAILABLE:
         
         history = market_copilot.get_conversation_history()
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Conversation history retrieved",
             data={"history": history}
         )
     
     
-    @app.get(f"{settings.api_prefix}/copilot/suggestions")
+    @router.get("/copilot/suggestions")
     async def get_query_suggestions():
         """Get suggested queries based on available data."""
         if not market_copilot:
@@ -425,43 +771,46 @@ if FASTAPI_AVAILABLE:
         
         suggestions = market_copilot.suggest_queries()
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Query suggestions generated",
             data={"suggestions": suggestions}
         )
     
     
     # Data Management Endpoints
-    @app.get(f"{settings.api_prefix}/data/status")
-    async def get_data_status():
+    @router.get("/data/status")
+    async def get_data_status(request: Request):
         """Get status of loaded data."""
         if not data_loader:
             raise HTTPException(status_code=503, detail="Data loader not available")
         
-        status = {
-            "data_directory": data_loader.data_dir,
-            "available_datasets": [],
+        if data_files_present is None:
+            _build_status_cache()
+        
+        dynamic = _cached_payload("data_status", lambda: {
             "pricing_engine_symbols": pricing_engine.get_available_symbols() if pricing_engine else [],
             "forecasting_models": forecasting_engine.get_model_info() if forecasting_engine else {}
+        })
+        
+        status = {
+            "data_directory": data_loader.data_dir,
+            "available_datasets": [file for file, present in data_files_present.items() if present],
+            **dynamic
         }
         
-        # Check for available CSV files
-        data_files = ['gold_prices.csv', 'silver_prices.csv', 'etf_prices.csv']
-        for file in data_files:
-            file_path = os.path.join(data_loader.data_dir, file)
-            if os.path.exists(file_path):
-                status["available_datasets"].append(file)
+        etag = payload_etag(status)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Data status retrieved",
-            data=status
+            data=status,
+            etag=etag
         )
     
     
-    @app.post(f"{settings.api_prefix}/data/reload")
-    @handle_exceptions
+    @router.post("/data/reload")
     async def reload_data(background_tasks: BackgroundTasks):
         """Reload data and retrain models."""
         if not data_loader or not forecasting_engine or not pricing_engine:
@@ -479,9 +828,10 @@ if FASTAPI_AVAILABLE:
                         forecasting_engine.train_model(data, symbol=symbol.upper())
                         
                         # Update pricing engine
-                        prices = data['close'].tolist()
-                        pricing_engine.update_price_history(symbol.upper(), prices)
+                        pricing_engine.update_price_history(symbol.upper(), data['close'].to_numpy(copy=False))
                 
+                _cache_frames(all_data)
+                _build_status_cache()
                 print(f"Data reloaded successfully for {len(all_data)} assets")
                 
             except Exception as e:
@@ -489,35 +839,27 @@ if FASTAPI_AVAILABLE:
         
         background_tasks.add_task(reload_task)
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Data reload initiated in background",
             data={"status": "reloading"}
         )
     
     
-    @app.get(f"{settings.api_prefix}/data/summary/{{symbol}}")
-    @handle_exceptions
+    @router.get("/data/summary/{symbol}")
     async def get_data_summary(symbol: str):
         """Get summary statistics for a symbol's data."""
         if not data_loader:
             raise HTTPException(status_code=503, detail="Data loader not available")
         
-        # Load data for the symbol
+        if symbol.lower() not in DATA_SOURCES:
+            raise HTTPException(status_code=400, detail="Invalid symbol. Must be gold, silver, or etf")
+        
+        # Serve from the frame loaded at startup unless the file has changed
         try:
-            if symbol.lower() == 'gold':
-                data = data_loader.load_gold_prices()
-            elif symbol.lower() == 'silver':
-                data = data_loader.load_silver_prices()
-            elif symbol.lower() == 'etf':
-                data = data_loader.load_etf_prices()
-            else:
-                raise HTTPException(status_code=400, detail="Invalid symbol. Must be gold, silver, or etf")
-            
+            data = _get_frame(symbol.lower())
             summary = data_loader.get_data_summary(data)
             
-            return APIResponse(
-                success=True,
+            return ok(
                 message=f"Data summary for {symbol}",
                 data=summary
             )
@@ -527,54 +869,48 @@ if FASTAPI_AVAILABLE:
     
     
     # System Information Endpoints
-    @app.get(f"{settings.api_prefix}/system/info")
-    async def get_system_info():
+    @router.get("/system/info")
+    async def get_system_info(request: Request):
         """Get system information and component status."""
-        info = {
-            "platform": "AI Retail Intelligence Platform",
-            "version": settings.app_version,
-            "components": {
-                "data_loader": data_loader is not None,
-                "forecasting_engine": forecasting_engine is not None,
-                "pricing_engine": pricing_engine is not None,
-                "document_parser": document_parser is not None,
-                "market_copilot": market_copilot is not None,
-                "competitive_pricing_engine": competitive_pricing_engine is not None
-            },
-            "configuration": {
-                "api_prefix": settings.api_prefix,
-                "data_directory": settings.data_dir,
-                "model_directory": settings.model_dir,
-                "default_forecast_horizon": settings.default_forecast_horizon
-            }
-        }
+        if system_info_static is None:
+            _build_status_cache()
         
-        # Add component-specific info
-        if forecasting_engine:
-            info["forecasting_models"] = forecasting_engine.get_available_models()
-        
-        if pricing_engine:
-            info["available_symbols"] = pricing_engine.get_available_symbols()
-        
-        if document_parser:
-            info["document_parser_info"] = document_parser.get_service_info()
+        def build_component_info():
+            component_info = {}
+            
+            if forecasting_engine:
+                component_info["forecasting_models"] = forecasting_engine.get_available_models()
+            
+            if pricing_engine:
+                component_info["available_symbols"] = pricing_engine.get_available_symbols()
+            
+            if document_parser:
+                component_info["document_parser_info"] = document_parser.get_service_info()
+            
+            if market_copilot:
+                component_info["copilot_stats"] = market_copilot.get_copilot_stats()
+            
+            if competitive_pricing_engine:
+                component_info["competitive_pricing_summary"] = competitive_pricing_engine.get_platform_summary()
+            
+            return component_info
         
-        if market_copilot:
-            info["copilot_stats"] = market_copilot.get_copilot_stats()
+        info = {**system_info_static, **_cached_payload("system_info", build_component_info)}
         
-        if competitive_pricing_engine:
-            info["competitive_pricing_summary"] = competitive_pricing_engine.get_platform_summary()
+        etag = payload_etag(info)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="System information retrieved",
-            data=info
+            data=info,
+            etag=etag
         )
     
     
     # Competitive Pricing Endpoints
-    @app.get(f"{settings.api_prefix}/price-comparison/{{product_name}}")
-    @handle_exceptions
+    @router.get("/price-comparison/{product_name}")
     async def get_price_comparison(product_name: str):
         """Get competitive price comparison for a product."""
         if not competitive_pricing_engine:
@@ -593,15 +929,13 @@ if FASTAPI_AVAILABLE:
         if not comparison:
             raise HTTPException(status_code=404, detail="No pricing data available for this product")
         
-        return APIResponse(
-            success=True,
+        return ok(
             message=f"Price comparison for {product_name}",
             data=comparison.to_dict()
         )
     
     
-    @app.get(f"{settings.api_prefix}/price-comparison/product/{{product_id}}")
-    @handle_exceptions
+    @router.get("/price-comparison/product/{product_id}")
     async def get_price_comparison_by_id(product_id: str):
         """Get competitive price comparison by product ID."""
         if not competitive_pricing_engine:
@@ -612,14 +946,13 @@ if FASTAPI_AVAILABLE:
         if not comparison:
             raise HTTPException(status_code=404, detail="No pricing data available for this product")
         
-        return APIResponse(
-            success=True,
+        return ok(
             message=f"Price comparison for product {product_id}",
             data=comparison.to_dict()
         )
     
     
-    @app.get(f"{settings.api_prefix}/price-comparison/products")
+    @router.get("/price-comparison/products")
     async def get_available_products():
         """Get list of available products for price comparison."""
         if not competitive_pricing_engine:
@@ -627,14 +960,13 @@ if FASTAPI_AVAILABLE:
         
         products = competitive_pricing_engine.get_product_list()
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Available products retrieved",
             data={"products": products}
         )
     
     
-    @app.get(f"{settings.api_prefix}/price-comparison/best-deals")
+    @router.get("/price-comparison/best-deals")
     async def get_best_deals(limit: int = 10):
         """Get products with the highest savings potential."""
         if not competitive_pricing_engine:
@@ -642,14 +974,13 @@ if FASTAPI_AVAILABLE:
         
         deals = competitive_pricing_engine.get_best_deals(limit)
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Best deals retrieved",
             data={"deals": deals}
         )
     
     
-    @app.get(f"{settings.api_prefix}/price-comparison/platforms/summary")
+    @router.get("/price-comparison/platforms/summary")
     async def get_platform_summary():
         """Get summary statistics for all platforms."""
         if not competitive_pricing_engine:
@@ -657,11 +988,13 @@ if FASTAPI_AVAILABLE:
         
         summary = competitive_pricing_engine.get_platform_summary()
         
-        return APIResponse(
-            success=True,
+        return ok(
             message="Platform summary retrieved",
             data=summary
         )
+    
+    
+    app.include_router(router)
 
 
 def create_app():
@@ -5,15 +5,28 @@ and integration settings for the AI Retail Intelligence Platform.
 """
 
 import os
-from typing import Dict, Any, List, Optional
+import time
+import string
+import functools
+import threading
+from collections import defaultdict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from src.config import settings
 
+# Bound once so the cost-tracking path skips the attribute lookup
+_now = datetime.now
 
-class BedrockModel(Enum):
-    """Available Bedrock foundation models."""
+
+class BedrockModel(str, Enum):
+    """Available Bedrock foundation models.
+    
+    Members are the model-id strings themselves, so no ``.value`` is needed.
+    """
     CLAUDE_3_SONNET = "anthropic.claude-3-sonnet-20240229-v1:0"
     CLAUDE_3_HAIKU = "anthropic.claude-3-haiku-20240307-v1:0"
     CLAUDE_3_OPUS = "anthropic.claude-3-opus-20240229-v1:0"
@@ -21,114 +34,158 @@ class BedrockModel(Enum):
     TITAN_TEXT_EXPRESS = "amazon.titan-text-express-v1"
     COHERE_COMMAND_TEXT = "cohere.command-text-v14"
     AI21_JURASSIC_ULTRA = "ai21.j2-ultra-v1"
+    
+    __str__ = str.__str__
 
 
-class BedrockRegion(Enum):
+class BedrockRegion(str, Enum):
     """AWS regions supporting Bedrock."""
     US_EAST_1 = "us-east-1"
     US_WEST_2 = "us-west-2"
     EU_WEST_1 = "eu-west-1"
     AP_SOUTHEAST_1 = "ap-southeast-1"
+    
+    __str__ = str.__str__
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelConfiguration:
-    """Configuration for a specific Bedrock model."""
+    """Immutable configuration for a specific Bedrock model."""
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10+
+    __slots__ = (
+        'model_id', 'display_name', 'provider', 'max_tokens', 'temperature_min',
+        'temperature_max', 'use_cases', 'cost_per_1k_tokens', 'strengths', 'limitations',
+        'cost_per_token'
+    )
+    
     model_id: str
     display_name: str
     provider: str
     max_tokens: int
-    temperature_range: tuple
-    use_cases: List[str]
+    temperature_min: float
+    temperature_max: float
+    use_cases: Tuple[str, ...]
     cost_per_1k_tokens: float
-    strengths: List[str]
-    limitations: List[str]
+    strengths: Tuple[str, ...]
+    limitations: Tuple[str, ...]
+    
+    def __post_init__(self):
+        # Derived slot (not a dataclass field) so cost tracking is a single multiply
+        object.__setattr__(self, 'cost_per_token', self.cost_per_1k_tokens / 1000.0)
+    
+    def __getstate__(self):
+        """Slot values for pickle/copy; there is no __dict__ to fall back on."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        """Restore slot values, bypassing the frozen __setattr__."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+# Per-model settings; model_id is filled in from the enum key by _model_config()
+_MODEL_SPECS = {
+    BedrockModel.CLAUDE_3_SONNET: dict(
+        display_name="Claude 3 Sonnet",
+        provider="Anthropic",
+        max_tokens=4096,
+        temperature_min=0.0,
+        temperature_max=1.0,
+        use_cases=(
+            "Complex financial analysis",
+            "Long-term forecasting",
+            "Risk assessment",
+            "Market sentiment analysis"
+        ),
+        cost_per_1k_tokens=0.003,
+        strengths=(
+            "Superior reasoning capabilities",
+            "Detailed explanations",
+            "Context understanding",
+            "Risk analysis"
+        ),
+        limitations=(
+            "Higher cost",
+            "Slower inference",
+            "Token limits"
+        )
+    ),
+    
+    BedrockModel.CLAUDE_3_HAIKU: dict(
+        display_name="Claude 3 Haiku",
+        provider="Anthropic",
+        max_tokens=4096,
+        temperature_min=0.0,
+        temperature_max=1.0,
+        use_cases=(
+            "Quick analysis",
+            "Real-time predictions",
+            "Simple forecasting",
+            "Data summarization"
+        ),
+        cost_per_1k_tokens=0.00025,
+        strengths=(
+            "Fast inference",
+            "Cost-effective",
+            "Good for simple tasks",
+            "Low latency"
+        ),
+        limitations=(
+            "Less complex reasoning",
+            "Shorter responses",
+            "Limited context"
+        )
+    ),
+    
+    BedrockModel.TITAN_TEXT_PREMIER: dict(
+        display_name="Titan Text Premier",
+        provider="Amazon",
+        max_tokens=3000,
+        temperature_min=0.0,
+        temperature_max=1.0,
+        use_cases=(
+            "General forecasting",
+            "Market analysis",
+            "Content generation",
+            "Data interpretation"
+        ),
+        cost_per_1k_tokens=0.0005,
+        strengths=(
+            "AWS native integration",
+            "Balanced performance",
+            "Good cost-performance ratio",
+            "Reliable predictions"
+        ),
+        limitations=(
+            "Less specialized for finance",
+            "Moderate reasoning depth",
+            "Generic responses"
+        )
+    )
+}
+
+
+def _model_config(model: BedrockModel, **spec) -> ModelConfiguration:
+    """Build a ModelConfiguration whose model_id is the model itself."""
+    return ModelConfiguration(model_id=model, **spec)
 
 
 class BedrockModelRegistry:
     """Registry of available Bedrock models with their configurations."""
     
+    __slots__ = ('models', '_use_case_index')
+    
     def __init__(self):
         """Initialize model registry."""
         self.models = {
-            BedrockModel.CLAUDE_3_SONNET: ModelConfiguration(
-                model_id=BedrockModel.CLAUDE_3_SONNET.value,
-                display_name="Claude 3 Sonnet",
-                provider="Anthropic",
-                max_tokens=4096,
-                temperature_range=(0.0, 1.0),
-                use_cases=[
-                    "Complex financial analysis",
-                    "Long-term forecasting",
-                    "Risk assessment",
-                    "Market sentiment analysis"
-                ],
-                cost_per_1k_tokens=0.003,
-                strengths=[
-                    "Superior reasoning capabilities",
-                    "Detailed explanations",
-                    "Context understanding",
-                    "Risk analysis"
-                ],
-                limitations=[
-                    "Higher cost",
-                    "Slower inference",
-                    "Token limits"
-                ]
-            ),
-            
-            BedrockModel.CLAUDE_3_HAIKU: ModelConfiguration(
-                model_id=BedrockModel.CLAUDE_3_HAIKU.value,
-                display_name="Claude 3 Haiku",
-                provider="Anthropic",
-                max_tokens=4096,
-                temperature_range=(0.0, 1.0),
-                use_cases=[
-                    "Quick analysis",
-                    "Real-time predictions",
-                    "Simple forecasting",
-                    "Data summarization"
-                ],
-                cost_per_1k_tokens=0.00025,
-                strengths=[
-                    "Fast inference",
-                    "Cost-effective",
-                    "Good for simple tasks",
-                    "Low latency"
-                ],
-                limitations=[
-                    "Less complex reasoning",
-                    "Shorter responses",
-                    "Limited context"
-                ]
-            ),
-            
-            BedrockModel.TITAN_TEXT_PREMIER: ModelConfiguration(
-                model_id=BedrockModel.TITAN_TEXT_PREMIER.value,
-                display_name="Titan Text Premier",
-                provider="Amazon",
-                max_tokens=3000,
-                temperature_range=(0.0, 1.0),
-                use_cases=[
-                    "General forecasting",
-                    "Market analysis",
-                    "Content generation",
-                    "Data interpretation"
-                ],
-                cost_per_1k_tokens=0.0005,
-                strengths=[
-                    "AWS native integration",
-                    "Balanced performance",
-                    "Good cost-performance ratio",
-                    "Reliable predictions"
-                ],
-                limitations=[
-                    "Less specialized for finance",
-                    "Moderate reasoning depth",
-                    "Generic responses"
-                ]
-            )
+            model: _model_config(model, **spec) for model, spec in _MODEL_SPECS.items()
         }
+        
+        # Inverted index: lowercased use case -> models that support it
+        self._use_case_index = {}
+        for model, config in self.models.items():
+            for use_case in config.use_cases:
+                self._use_case_index.setdefault(use_case.lower(), []).append(model)
     
     def get_model_config(self, model: BedrockModel) -> ModelConfiguration:
         """Get configuration for a specific model."""
@@ -136,11 +193,7 @@ class BedrockModelRegistry:
     
     def get_models_by_use_case(self, use_case: str) -> List[BedrockModel]:
         """Get models suitable for a specific use case."""
-        suitable_models = []
-        for model, config in self.models.items():
-            if use_case.lower() in [uc.lower() for uc in config.use_cases]:
-                suitable_models.append(model)
-        return suitable_models
+        return list(self._use_case_index.get(use_case.lower(), []))
     
     def get_cost_comparison(self) -> Dict[str, float]:
         """Get cost comparison across models."""
@@ -150,12 +203,48 @@ class BedrockModelRegistry:
         }
 
 
+@functools.lru_cache(maxsize=1)
+def get_model_registry() -> BedrockModelRegistry:
+    """Get the shared model registry, built once per process."""
+    return BedrockModelRegistry()
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_model_parameters(model: 'BedrockModel', default_max_tokens: int,
+                              default_temperature: float) -> Mapping[str, Any]:
+    """Clamp the default request parameters to a model's limits (read-only, cached)."""
+    config = get_model_registry().get_model_config(model)
+    
+    if not config:
+        return MappingProxyType({})
+    
+    if default_temperature < config.temperature_min:
+        temperature = config.temperature_min
+    else:
+        temperature = min(default_temperature, config.temperature_max)
+    
+    return MappingProxyType({
+        'max_tokens': min(default_max_tokens, config.max_tokens),
+        'temperature': temperature,
+        'top_p': 0.9,
+        'stop_sequences': ()
+    })
+
+
 class BedrockSettings:
     """Settings and configuration for Bedrock integration."""
     
+    __slots__ = (
+        'aws_region', 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token',
+        'default_model', 'fallback_model', 'default_max_tokens', 'default_temperature',
+        'request_timeout', 'max_retries', 'daily_cost_limit', 'monthly_cost_limit',
+        'cost_tracking_enabled', 'enable_caching', 'cache_ttl', 'parallel_requests',
+        '_credentials_valid', '_client_config'
+    )
+    
     def __init__(self):
         """Initialize Bedrock settings."""
-        self.aws_region = os.getenv('BEDROCK_REGION', BedrockRegion.US_EAST_1.value)
+        self.aws_region = os.getenv('BEDROCK_REGION', BedrockRegion.US_EAST_1)
         self.aws_access_key_id = os.getenv('AWS_ACCESS_KEY_ID')
         self.aws_secret_access_key = os.getenv('AWS_SECRET_ACCESS_KEY')
         self.aws_session_token = os.getenv('AWS_SESSION_TOKEN')
@@ -180,65 +269,64 @@ class BedrockSettings:
         self.cache_ttl = 3600  # 1 hour
         self.parallel_requests = 5
         
-    def get_model_parameters(self, model: BedrockModel) -> Dict[str, Any]:
-        """Get default parameters for a model."""
-        registry = BedrockModelRegistry()
-        config = registry.get_model_config(model)
-        
-        if not config:
-            return {}
-        
-        return {
-            'max_tokens': min(self.default_max_tokens, config.max_tokens),
-            'temperature': max(
-                config.temperature_range[0], 
-                min(self.default_temperature, config.temperature_range[1])
-            ),
-            'top_p': 0.9,
-            'stop_sequences': []
-        }
+        # Lazily computed; cleared by invalidate_cache()
+        self._credentials_valid = None
+        self._client_config = None
+    
+    def invalidate_cache(self) -> None:
+        """Re-read credentials from the environment and drop cached derived values."""
+        self.aws_region = os.getenv('BEDROCK_REGION', BedrockRegion.US_EAST_1)
+        self.aws_access_key_id = os.getenv('AWS_ACCESS_KEY_ID')
+        self.aws_secret_access_key = os.getenv('AWS_SECRET_ACCESS_KEY')
+        self.aws_session_token = os.getenv('AWS_SESSION_TOKEN')
+        self._credentials_valid = None
+        self._client_config = None
+
+    def get_model_parameters(self, model: BedrockModel) -> Mapping[str, Any]:
+        """Get default parameters for a model (a shared, read-only mapping)."""
+        return _compute_model_parameters(model, self.default_max_tokens, self.default_temperature)
     
     def validate_credentials(self) -> bool:
         """Validate AWS credentials."""
-        required_vars = ['AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY']
-        return all(os.getenv(var) for var in required_vars)
+        if self._credentials_valid is None:
+            self._credentials_valid = bool(self.aws_access_key_id and self.aws_secret_access_key)
+        return self._credentials_valid
     
-    def get_client_config(self) -> Dict[str, Any]:
-        """Get configuration for Bedrock client."""
-        return {
-            'region_name': self.aws_region,
-            'aws_access_key_id': self.aws_access_key_id,
-            'aws_secret_access_key': self.aws_secret_access_key,
-            'aws_session_token': self.aws_session_token,
-            'config': {
-                'retries': {'max_attempts': self.max_retries},
-                'read_timeout': self.request_timeout
-            }
-        }
-
-
-class BedrockPromptTemplates:
-    """Templates for Bedrock prompts for different use cases."""
-    
-    @staticmethod
-    def forecasting_prompt(
-        symbol: str, 
-        historical_data: str, 
-        horizon: int, 
-        context: Optional[str] = None
-    ) -> str:
-        """Generate forecasting prompt template."""
-        return f"""
-You are an expert financial analyst specializing in {symbol} price forecasting. 
+    def get_client_config(self) -> Mapping[str, Any]:
+        """Get configuration for Bedrock client (read-only, nested mappings included).
+        
+        The mapping is rebuilt whenever a setting it is built from changes. Credentials
+        are taken from the attributes, which only re-read the environment in invalidate_cache().
+        """
+        key = (self.aws_region, self.aws_access_key_id, self.aws_secret_access_key,
+               self.aws_session_token, self.max_retries, self.request_timeout)
+        if self._client_config is None or self._client_config[0] != key:
+            self._client_config = (key, MappingProxyType({
+                'region_name': self.aws_region,
+                'aws_access_key_id': self.aws_access_key_id,
+                'aws_secret_access_key': self.aws_secret_access_key,
+                'aws_session_token': self.aws_session_token,
+                'config': MappingProxyType({
+                    'retries': MappingProxyType({'max_attempts': self.max_retries}),
+                    'read_timeout': self.request_timeout
+                })
+            }))
+        return self._client_config[1]
+
+# Static scaffolding of the forecasting prompt; only the historical data and
+# optional context vary between calls for the same (symbol, horizon).
+_FORECAST_HEADER = string.Template("""
+You are an expert financial analyst specializing in $symbol price forecasting. 
 Analyze the provided historical data and generate accurate price predictions.
 
-Asset: {symbol}
-Forecast Horizon: {horizon} days
-Historical Data: {historical_data}
-{f"Additional Context: {context}" if context else ""}
+Asset: $symbol
+Forecast Horizon: $horizon days
+Historical Data: """)
+
+_FORECAST_FOOTER = string.Template("""
 
 Please provide:
-1. Daily price predictions for the next {horizon} days
+1. Daily price predictions for the next $horizon days
 2. 95% confidence intervals for each prediction
 3. Detailed reasoning for your forecast
 4. Risk assessment and volatility expectations
@@ -246,16 +334,14 @@ Please provide:
 6. Alternative scenarios (bull/bear cases)
 
 Format your response as structured JSON with clear numerical predictions and explanations.
-"""
-    
-    @staticmethod
-    def risk_assessment_prompt(market_data: str, symbol: str) -> str:
-        """Generate risk assessment prompt template."""
-        return f"""
-As a risk management expert, analyze the following market data for {symbol} and provide 
+""")
+
+# Remaining prompt templates, parsed once at import
+_RISK_ASSESSMENT_TEMPLATE = string.Template("""
+As a risk management expert, analyze the following market data for $symbol and provide 
 a comprehensive risk assessment.
 
-Market Data: {market_data}
+Market Data: $market_data
 
 Provide analysis on:
 1. Overall risk level (low/medium/high)
@@ -267,15 +353,12 @@ Provide analysis on:
 7. Correlation risks with other assets
 
 Format as JSON with quantitative risk metrics and qualitative insights.
-"""
-    
-    @staticmethod
-    def market_sentiment_prompt(news_data: str, symbol: str) -> str:
-        """Generate market sentiment analysis prompt."""
-        return f"""
-Analyze the market sentiment for {symbol} based on the following information:
+""")
 
-News and Market Data: {news_data}
+_MARKET_SENTIMENT_TEMPLATE = string.Template("""
+Analyze the market sentiment for $symbol based on the following information:
+
+News and Market Data: $news_data
 
 Provide sentiment analysis including:
 1. Overall sentiment score (-1 to +1)
@@ -286,15 +369,12 @@ Provide sentiment analysis including:
 6. Confidence level in sentiment assessment
 
 Return structured JSON with sentiment metrics and explanations.
-"""
-    
-    @staticmethod
-    def competitive_analysis_prompt(competitor_data: str, symbol: str) -> str:
-        """Generate competitive analysis prompt."""
-        return f"""
-Perform competitive analysis for {symbol} in the retail/commerce market:
+""")
 
-Competitor Data: {competitor_data}
+_COMPETITIVE_ANALYSIS_TEMPLATE = string.Template("""
+Perform competitive analysis for $symbol in the retail/commerce market:
+
+Competitor Data: $competitor_data
 
 Analyze:
 1. Competitive positioning
@@ -305,88 +385,166 @@ Analyze:
 6. Strategic recommendations
 
 Provide actionable insights in JSON format.
-"""
+""")
+
+
+@functools.lru_cache(maxsize=256)
+def _forecast_scaffold(symbol: str, horizon: int) -> Tuple[str, str]:
+    """Pre-format the (header, footer) of the forecasting prompt for a symbol/horizon."""
+    return (
+        _FORECAST_HEADER.substitute(symbol=symbol, horizon=horizon),
+        _FORECAST_FOOTER.substitute(horizon=horizon)
+    )
+
+
+class BedrockPromptTemplates:
+    """Templates for Bedrock prompts for different use cases."""
+    
+    @staticmethod
+    def forecasting_prompt(
+        symbol: str, 
+        historical_data: str, 
+        horizon: int, 
+        context: Optional[str] = None
+    ) -> str:
+        """Generate forecasting prompt template."""
+        header, footer = _forecast_scaffold(symbol, horizon)
+        return ''.join((
+            header,
+            historical_data,
+            '\n',
+            f"Additional Context: {context}" if context else "",
+            footer
+        ))
+    
+    @staticmethod
+    def risk_assessment_prompt(market_data: str, symbol: str) -> str:
+        """Generate risk assessment prompt template."""
+        return _RISK_ASSESSMENT_TEMPLATE.substitute(market_data=market_data, symbol=symbol)
+    
+    @staticmethod
+    def market_sentiment_prompt(news_data: str, symbol: str) -> str:
+        """Generate market sentiment analysis prompt."""
+        return _MARKET_SENTIMENT_TEMPLATE.substitute(news_data=news_data, symbol=symbol)
+    
+    @staticmethod
+    def competitive_analysis_prompt(competitor_data: str, symbol: str) -> str:
+        """Generate competitive analysis prompt."""
+        return _COMPETITIVE_ANALYSIS_TEMPLATE.substitute(competitor_data=competitor_data, symbol=symbol)
+
+
+class UseCaseConfig(NamedTuple):
+    """Model selection and parameters for a business use case."""
+    primary_model: BedrockModel
+    fallback_model: BedrockModel
+    parameters: Mapping[str, Any]
+    prompt_template: str
+
+
+# Built once at import; read-only so every mapper can share it
+_USE_CASE_MAPPINGS: Mapping[str, UseCaseConfig] = MappingProxyType({
+    'short_term_forecasting': UseCaseConfig(
+        primary_model=BedrockModel.CLAUDE_3_HAIKU,
+        fallback_model=BedrockModel.TITAN_TEXT_EXPRESS,
+        parameters=MappingProxyType({'temperature': 0.05, 'max_tokens': 2000}),
+        prompt_template='forecasting_prompt'
+    ),
+    'long_term_forecasting': UseCaseConfig(
+        primary_model=BedrockModel.CLAUDE_3_SONNET,
+        fallback_model=BedrockModel.CLAUDE_3_HAIKU,
+        parameters=MappingProxyType({'temperature': 0.1, 'max_tokens': 4000}),
+        prompt_template='forecasting_prompt'
+    ),
+    'risk_assessment': UseCaseConfig(
+        primary_model=BedrockModel.CLAUDE_3_SONNET,
+        fallback_model=BedrockModel.TITAN_TEXT_PREMIER,
+        parameters=MappingProxyType({'temperature': 0.0, 'max_tokens': 3000}),
+        prompt_template='risk_assessment_prompt'
+    ),
+    'market_sentiment': UseCaseConfig(
+        primary_model=BedrockModel.CLAUDE_3_SONNET,
+        fallback_model=BedrockModel.CLAUDE_3_HAIKU,
+        parameters=MappingProxyType({'temperature': 0.2, 'max_tokens': 2500}),
+        prompt_template='market_sentiment_prompt'
+    ),
+    'competitive_analysis': UseCaseConfig(
+        primary_model=BedrockModel.CLAUDE_3_SONNET,
+        fallback_model=BedrockModel.TITAN_TEXT_PREMIER,
+        parameters=MappingProxyType({'temperature': 0.15, 'max_tokens': 3500}),
+        prompt_template='competitive_analysis_prompt'
+    ),
+    'real_time_analysis': UseCaseConfig(
+        primary_model=BedrockModel.CLAUDE_3_HAIKU,
+        fallback_model=BedrockModel.TITAN_TEXT_EXPRESS,
+        parameters=MappingProxyType({'temperature': 0.1, 'max_tokens': 1500}),
+        prompt_template='forecasting_prompt'
+    )
+})
+_USE_CASE_NAMES = tuple(_USE_CASE_MAPPINGS.keys())
 
 
 class BedrockUseCaseMapper:
     """Maps business use cases to optimal Bedrock models and configurations."""
     
+    __slots__ = ('use_case_mappings',)
+    
     def __init__(self):
         """Initialize use case mapper."""
-        self.use_case_mappings = {
-            'short_term_forecasting': {
-                'primary_model': BedrockModel.CLAUDE_3_HAIKU,
-                'fallback_model': BedrockModel.TITAN_TEXT_EXPRESS,
-                'parameters': {'temperature': 0.05, 'max_tokens': 2000},
-                'prompt_template': 'forecasting_prompt'
-            },
-            'long_term_forecasting': {
-                'primary_model': BedrockModel.CLAUDE_3_SONNET,
-                'fallback_model': BedrockModel.CLAUDE_3_HAIKU,
-                'parameters': {'temperature': 0.1, 'max_tokens': 4000},
-                'prompt_template': 'forecasting_prompt'
-            },
-            'risk_assessment': {
-                'primary_model': BedrockModel.CLAUDE_3_SONNET,
-                'fallback_model': BedrockModel.TITAN_TEXT_PREMIER,
-                'parameters': {'temperature': 0.0, 'max_tokens': 3000},
-                'prompt_template': 'risk_assessment_prompt'
-            },
-            'market_sentiment': {
-                'primary_model': BedrockModel.CLAUDE_3_SONNET,
-                'fallback_model': BedrockModel.CLAUDE_3_HAIKU,
-                'parameters': {'temperature': 0.2, 'max_tokens': 2500},
-                'prompt_template': 'market_sentiment_prompt'
-            },
-            'competitive_analysis': {
-                'primary_model': BedrockModel.CLAUDE_3_SONNET,
-                'fallback_model': BedrockModel.TITAN_TEXT_PREMIER,
-                'parameters': {'temperature': 0.15, 'max_tokens': 3500},
-                'prompt_template': 'competitive_analysis_prompt'
-            },
-            'real_time_analysis': {
-                'primary_model': BedrockModel.CLAUDE_3_HAIKU,
-                'fallback_model': BedrockModel.TITAN_TEXT_EXPRESS,
-                'parameters': {'temperature': 0.1, 'max_tokens': 1500},
-                'prompt_template': 'forecasting_prompt'
-            }
-        }
+        self.use_case_mappings = _USE_CASE_MAPPINGS
     
-    def get_optimal_config(self, use_case: str) -> Dict[str, Any]:
+    def get_optimal_config(self, use_case: str) -> Optional[UseCaseConfig]:
         """Get optimal model configuration for a use case."""
-        return self.use_case_mappings.get(use_case, {})
+        return self.use_case_mappings.get(use_case)
     
     def get_available_use_cases(self) -> List[str]:
         """Get list of available use cases."""
-        return list(self.use_case_mappings.keys())
+        return list(_USE_CASE_NAMES)
 
 
 # Cost tracking and monitoring
 class BedrockCostTracker:
     """Track and monitor Bedrock usage costs."""
     
+    __slots__ = (
+        'daily_usage', 'monthly_usage', 'cost_alerts', 'total_requests',
+        '_keys', '_keys_expire_at', '_lock'
+    )
+    
     def __init__(self):
         """Initialize cost tracker."""
-        self.daily_usage = {}
-        self.monthly_usage = {}
+        self.daily_usage = defaultdict(float)
+        self.monthly_usage = defaultdict(float)
         self.cost_alerts = []
+        self.total_requests = 0
+        self._keys = ('', '')
+        self._keys_expire_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _current_keys(self) -> Tuple[str, str]:
+        """Get the (day, month) usage keys, re-reading the clock at most once a second."""
+        now = time.monotonic()
+        if now >= self._keys_expire_at:
+            today = _now().strftime('%Y-%m-%d')
+            self._keys = (today, today[:7])
+            self._keys_expire_at = now + 1.0
+        return self._keys
     
     def track_request(self, model: BedrockModel, tokens_used: int) -> float:
         """Track a Bedrock request and calculate cost."""
-        registry = BedrockModelRegistry()
-        config = registry.get_model_config(model)
+        config = get_model_registry().get_model_config(model)
         
         if not config:
             return 0.0
         
-        cost = (tokens_used / 1000) * config.cost_per_1k_tokens
+        cost = tokens_used * config.cost_per_token
         
         # Update usage tracking
-        today = str(datetime.now().date())
-        month = str(datetime.now().strftime('%Y-%m'))
+        today, month = self._current_keys()
         
-        self.daily_usage[today] = self.daily_usage.get(today, 0) + cost
-        self.monthly_usage[month] = self.monthly_usage.get(month, 0) + cost
+        with self._lock:
+            self.daily_usage[today] += cost
+            self.monthly_usage[month] += cost
+            self.total_requests += 1
         
         return cost
     
@@ -394,8 +552,7 @@ class BedrockCostTracker:
         """Check if cost limits are exceeded."""
         alerts = []
         
-        today = str(datetime.now().date())
-        month = str(datetime.now().strftime('%Y-%m'))
+        today, month = self._current_keys()
         
         daily_cost = self.daily_usage.get(today, 0)
         monthly_cost = self.monthly_usage.get(month, 0)
@@ -410,11 +567,17 @@ class BedrockCostTracker:
     
     def get_usage_report(self) -> Dict[str, Any]:
         """Get usage and cost report."""
+        # Hold the lock only for the shallow copies so readers get a consistent snapshot
+        with self._lock:
+            daily_usage = dict(self.daily_usage)
+            monthly_usage = dict(self.monthly_usage)
+            total_requests = self.total_requests
+        
         return {
-            'daily_usage': self.daily_usage,
-            'monthly_usage': self.monthly_usage,
-            'total_requests': sum(len(usage) for usage in [self.daily_usage, self.monthly_usage]),
-            'alerts': self.cost_alerts
+            'daily_usage': daily_usage,
+            'monthly_usage': monthly_usage,
+            'total_requests': total_requests,
+            'alerts': list(self.cost_alerts)
         }
 
 
@@ -424,18 +587,18 @@ def example_bedrock_config():
     
     # Initialize components
     settings = BedrockSettings()
-    registry = BedrockModelRegistry()
+    registry = get_model_registry()
     mapper = BedrockUseCaseMapper()
     cost_tracker = BedrockCostTracker()
     
     print("Bedrock Configuration Framework:")
-    print(f"Default Model: {settings.default_model.value}")
+    print(f"Default Model: {settings.default_model}")
     print(f"Available Models: {len(registry.models)}")
     print(f"Use Cases: {mapper.get_available_use_cases()}")
     
     # Get optimal config for forecasting
     forecast_config = mapper.get_optimal_config('long_term_forecasting')
-    print(f"Forecasting Model: {forecast_config.get('primary_model')}")
+    print(f"Forecasting Model: {forecast_config.primary_model}")
     
     return {
         'settings': settings,
@@ -5,17 +5,188 @@ for advanced forecasting and prediction capabilities. This is a documentation fr
 and does not include actual Bedrock connections.
 """
 
+import copy
 import json
+import asyncio
+import hashlib
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from collections import OrderedDict
+from types import MappingProxyType
 import boto3
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Final, Iterator, Mapping, Union
+from dataclasses import dataclass, replace
 from abc import ABC, abstractmethod
 
+try:
+    import numpy as np
+    from src._bedrock_numba import trend_code, trend_codes, weighted_average
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.config import settings
 from src.exceptions import LLMServiceError, ForecastingError
 from src.logger import app_logger
 
+_now = datetime.now
+
+# Symbols classified as commodities in the model context
+_COMMODITY_SYMBOLS: Final = frozenset({'gold', 'silver', 'oil', 'copper', 'platinum'})
+
+# Read-only constants handed out by the engine and config, built once at import
+_EMPTY_MAPPING: Final = MappingProxyType({})
+
+_DEFAULT_PARAMETERS: Final = MappingProxyType({
+    'max_tokens': 4000,
+    'temperature': 0.1,
+    'top_p': 0.9
+})
+
+_MODEL_CAPABILITIES: Final = MappingProxyType({
+    'claude': MappingProxyType({
+        'strengths': ('Complex reasoning', 'Detailed explanations', 'Risk assessment'),
+        'use_cases': ('Long-term forecasting', 'Market analysis', 'Risk evaluation'),
+        'max_horizon': 365
+    }),
+    'titan': MappingProxyType({
+        'strengths': ('Fast inference', 'Stable predictions', 'Cost-effective'),
+        'use_cases': ('Short-term forecasting', 'Real-time predictions', 'Batch processing'),
+        'max_horizon': 90
+    })
+})
+
+# Indexed by the codes returned from src._bedrock_numba.trend_code
+_TREND_LABELS = ('insufficient_data', 'bullish', 'bearish', 'neutral')
+
+# Prompt templates are parsed once at import and filled with substitute() per call
+_FORECAST_PROMPT_TEMPLATE: Final = string.Template("""
+        You are an expert financial analyst and forecaster. Analyze the following market data 
+        and provide detailed price forecasts.
+        
+        Asset: $symbol
+        Forecast Horizon: $horizon days
+        
+        Historical Data Summary:
+        $hist
+        
+        Context Information:
+        $ctx
+        
+        Please provide:
+        1. Price predictions for the next $horizon days
+        2. Confidence intervals (95% confidence level)
+        3. Detailed explanation of your reasoning
+        4. Risk assessment including potential volatility
+        5. Key market insights and factors influencing the forecast
+        
+        Format your response as JSON with the following structure:
+        {
+            "predictions": [list of predicted prices],
+            "confidence_intervals": [
+                {"lower": float, "upper": float, "day": int}
+            ],
+            "explanation": "detailed reasoning",
+            "risk_assessment": {
+                "volatility_level": "low/medium/high",
+                "key_risks": ["risk1", "risk2"],
+                "confidence_score": float
+            },
+            "market_insights": ["insight1", "insight2"]
+        }
+        """)
+
+_EXPLANATION_PROMPT_TEMPLATE: Final = string.Template("""
+        Explain the following price prediction in simple terms for retail stakeholders:
+        
+        Prediction Data: $data
+        
+        Provide a clear, concise explanation suitable for business decision-making.
+        """)
+
+_RISK_PROMPT_TEMPLATE: Final = string.Template("""
+        Assess the market risk based on the following data:
+        
+        Market Data: $data
+        
+        Provide risk assessment including volatility, potential downside, and risk mitigation strategies.
+        """)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from Bedrock, preferring orjson over the stdlib decoder."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode()
+    return _JSON_DECODER.decode(data)
+
+
+def _iter_stream_text(events) -> Iterator[str]:
+    """Yield text deltas from an invoke_model_with_response_stream event stream."""
+    for event in events:
+        chunk = event.get('chunk')
+        if not chunk:
+            continue
+        
+        payload = _loads(chunk['bytes'])
+        if payload.get('type') == 'content_block_delta':
+            text = payload.get('delta', {}).get('text')
+            if text:
+                yield text
+
+
+def _summarize_history(data: List[Dict[str, Any]], closes: Optional['np.ndarray'] = None) -> str:
+    """Summarize the recent close prices of a series for a forecasting prompt."""
+    if not data:
+        return "No historical data available"
+    
+    if closes is None and NUMPY_AVAILABLE:
+        closes = _extract_closes(data[-30:])
+    
+    if closes is not None:
+        prices = closes[-30:]  # Last 30 data points (a view, no copy)
+        pmin, pmax, plast, pmean = prices.min(), prices.max(), prices[-1], prices.mean()
+    else:
+        prices = [d.get('close', 0) for d in data[-30:]]
+        pmin, pmax, plast, pmean = min(prices), max(prices), prices[-1], sum(prices) / len(prices)
+    
+    summary = f"""
+        Data Points: {len(data)} total, {len(prices)} recent
+        Recent Price Range: ${pmin:.2f} - ${pmax:.2f}
+        Latest Price: ${plast:.2f}
+        30-day Average: ${pmean:.2f}
+        """
+    
+    return summary
+
+
+def _extract_closes(data: List[Dict[str, Any]]) -> 'np.ndarray':
+    """Collect close prices into a contiguous float64 array."""
+    return np.fromiter((d.get('close', 0.0) for d in data), dtype=np.float64, count=len(data))
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize data as 2-space indented JSON for embedding in prompts."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2)
+
 
 @dataclass
 class BedrockForecastRequest:
@@ -24,13 +195,25 @@ class BedrockForecastRequest:
     historical_data: List[Dict[str, Any]]
     forecast_horizon: int
     model_id: str
-    parameters: Dict[str, Any]
+    parameters: Mapping[str, Any]
     context: Optional[Dict[str, Any]] = None
+    # Close prices as a float64 array, parallel to historical_data
+    closes: Optional['np.ndarray'] = None
+    # Shared timestamp for batch calls; responses are stamped with it when set
+    requested_at: Optional[datetime] = None
+    # Prompt summary of historical_data, computed once when several models share a request
+    historical_summary: Optional[str] = None
 
 
 @dataclass
 class BedrockForecastResponse:
     """Response model for Bedrock forecasting results."""
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10+
+    __slots__ = (
+        'symbol', 'predictions', 'confidence_intervals', 'model_explanation',
+        'risk_assessment', 'market_insights', 'timestamp'
+    )
+    
     symbol: str
     predictions: List[float]
     confidence_intervals: List[Dict[str, float]]
@@ -50,16 +233,32 @@ class BedrockForecastResponse:
             'market_insights': self.market_insights,
             'timestamp': self.timestamp.isoformat()
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes, using orjson's native dataclass support when available."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self)
+        return json.dumps(self.to_dict()).encode()
 
 
 class BedrockModelInterface(ABC):
     """Abstract interface for Bedrock foundation models."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def generate_forecast(self, request: BedrockForecastRequest) -> BedrockForecastResponse:
         """Generate forecast using the foundation model."""
         pass
     
+    async def generate_forecast_async(self, request: BedrockForecastRequest) -> BedrockForecastResponse:
+        """Generate forecast without blocking the event loop."""
+        # boto3 calls block, so run them on a worker thread; an aioboto3-backed
+        # forecaster can override this and await invoke_model directly:
+        # async with aioboto3.Session().client('bedrock-runtime') as client:
+        #     response = await client.invoke_model(modelId=self.model_id, body=...)
+        return await asyncio.to_thread(self.generate_forecast, request)
+    
     @abstractmethod
     def explain_prediction(self, prediction_data: Dict[str, Any]) -> str:
         """Generate explanation for the prediction."""
@@ -69,16 +268,7 @@ class BedrockModelInterface(ABC):
     def assess_risk(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess market risk using the model."""
         pass
-
-
-class ClaudeForecaster(BedrockModelInterface):
-    """Claude-based forecasting implementation framework."""
     
-    def __init__(self, model_id: str = "anthropic.claude-3-sonnet-20240229-v1:0"):
-        """Initialize Claude forecaster."""
-        self.model_id = model_id
-        self.bedrock_client = None  # Will be initialized when needed
-        
     def _initialize_bedrock_client(self):
         """Initialize Bedrock client (framework only)."""
         # Framework implementation - actual connection would be:
@@ -89,6 +279,17 @@ class ClaudeForecaster(BedrockModelInterface):
         #     aws_secret_access_key=settings.aws_secret_access_key
         # )
         app_logger.info("Bedrock client initialization framework ready")
+
+
+class ClaudeForecaster(BedrockModelInterface):
+    """Claude-based forecasting implementation framework."""
+    
+    __slots__ = ('model_id', 'bedrock_client')
+    
+    def __init__(self, model_id: str = "anthropic.claude-3-sonnet-20240229-v1:0"):
+        """Initialize Claude forecaster."""
+        self.model_id = model_id
+        self.bedrock_client = None  # Will be initialized when needed
     
     def generate_forecast(self, request: BedrockForecastRequest) -> BedrockForecastResponse:
         """Generate forecast using Claude."""
@@ -108,47 +309,20 @@ class ClaudeForecaster(BedrockModelInterface):
     
     def _create_forecasting_prompt(self, request: BedrockForecastRequest) -> str:
         """Create structured prompt for forecasting."""
-        historical_summary = self._summarize_historical_data(request.historical_data)
+        historical_summary = request.historical_summary
+        if historical_summary is None:
+            historical_summary = self._summarize_historical_data(request.historical_data, request.closes)
         
-        prompt = f"""
-        You are an expert financial analyst and forecaster. Analyze the following market data 
-        and provide detailed price forecasts.
-        
-        Asset: {request.symbol}
-        Forecast Horizon: {request.forecast_horizon} days
-        
-        Historical Data Summary:
-        {historical_summary}
-        
-        Context Information:
-        {json.dumps(request.context, indent=2) if request.context else 'None'}
-        
-        Please provide:
-        1. Price predictions for the next {request.forecast_horizon} days
-        2. Confidence intervals (95% confidence level)
-        3. Detailed explanation of your reasoning
-        4. Risk assessment including potential volatility
-        5. Key market insights and factors influencing the forecast
-        
-        Format your response as JSON with the following structure:
-        {{
-            "predictions": [list of predicted prices],
-            "confidence_intervals": [
-                {{"lower": float, "upper": float, "day": int}}
-            ],
-            "explanation": "detailed reasoning",
-            "risk_assessment": {{
-                "volatility_level": "low/medium/high",
-                "key_risks": ["risk1", "risk2"],
-                "confidence_score": float
-            }},
-            "market_insights": ["insight1", "insight2"]
-        }}
-        """
+        prompt = _FORECAST_PROMPT_TEMPLATE.substitute(
+            symbol=request.symbol,
+            horizon=request.forecast_horizon,
+            hist=historical_summary,
+            ctx=_dumps_indented(request.context) if request.context else 'None'
+        )
         
         return prompt
     
-    def _call_bedrock_api(self, prompt: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    def _call_bedrock_api(self, prompt: str, parameters: Mapping[str, Any]) -> Dict[str, Any]:
         """Framework for calling Bedrock API."""
         # This is a framework implementation
         # Actual implementation would be:
@@ -165,13 +339,14 @@ class ClaudeForecaster(BedrockModelInterface):
         #     ]
         # }
         
-        # response = self.bedrock_client.invoke_model(
+        # Stream the completion so text is consumed as it is generated rather
+        # than after the whole response body has been buffered:
+        # response = self.bedrock_client.invoke_model_with_response_stream(
         #     modelId=self.model_id,
         #     body=json.dumps(body)
         # )
         
-        # response_body = json.loads(response['body'].read())
-        # return response_body['content'][0]['text']
+        # return _loads(''.join(_iter_stream_text(response['body'])))
         
         # Framework mock response
         mock_response = {
@@ -192,8 +367,11 @@ class ClaudeForecaster(BedrockModelInterface):
         app_logger.info("Bedrock API call framework executed")
         return mock_response
     
-    def _parse_forecast_response(self, response: Dict[str, Any], request: BedrockForecastRequest) -> BedrockForecastResponse:
+    def _parse_forecast_response(self, response: Union[Dict[str, Any], str, bytes], request: BedrockForecastRequest) -> BedrockForecastResponse:
         """Parse Bedrock response into structured format."""
+        if isinstance(response, (str, bytes)):
+            response = _loads(response)
+        
         return BedrockForecastResponse(
             symbol=request.symbol,
             predictions=response.get('predictions', []),
@@ -201,36 +379,23 @@ class ClaudeForecaster(BedrockModelInterface):
             model_explanation=response.get('explanation', ''),
             risk_assessment=response.get('risk_assessment', {}),
             market_insights=response.get('market_insights', []),
-            timestamp=datetime.now()
+            timestamp=request.requested_at or _now()
         )
     
-    def _summarize_historical_data(self, data: List[Dict[str, Any]]) -> str:
+    def _summarize_historical_data(
+        self, 
+        data: List[Dict[str, Any]], 
+        closes: Optional['np.ndarray'] = None
+    ) -> str:
         """Summarize historical data for prompt."""
-        if not data:
-            return "No historical data available"
-        
-        recent_data = data[-30:]  # Last 30 data points
-        prices = [d.get('close', 0) for d in recent_data]
-        
-        summary = f"""
-        Data Points: {len(data)} total, {len(recent_data)} recent
-        Recent Price Range: ${min(prices):.2f} - ${max(prices):.2f}
-        Latest Price: ${prices[-1]:.2f}
-        30-day Average: ${sum(prices) / len(prices):.2f}
-        """
-        
-        return summary
+        return _summarize_history(data, closes)
     
     def explain_prediction(self, prediction_data: Dict[str, Any]) -> str:
         """Generate explanation for prediction using Claude."""
         # Framework implementation
-        explanation_prompt = f"""
-        Explain the following price prediction in simple terms for retail stakeholders:
-        
-        Prediction Data: {json.dumps(prediction_data, indent=2)}
-        
-        Provide a clear, concise explanation suitable for business decision-making.
-        """
+        explanation_prompt = _EXPLANATION_PROMPT_TEMPLATE.substitute(
+            data=_dumps_indented(prediction_data)
+        )
         
         # Mock explanation for framework
         return "The forecast indicates a moderate upward trend based on historical patterns and current market conditions."
@@ -238,13 +403,9 @@ class ClaudeForecaster(BedrockModelInterface):
     def assess_risk(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess market risk using Claude."""
         # Framework implementation
-        risk_prompt = f"""
-        Assess the market risk based on the following data:
-        
-        Market Data: {json.dumps(market_data, indent=2)}
-        
-        Provide risk assessment including volatility, potential downside, and risk mitigation strategies.
-        """
+        risk_prompt = _RISK_PROMPT_TEMPLATE.substitute(
+            data=_dumps_indented(market_data)
+        )
         
         # Mock risk assessment for framework
         return {
@@ -260,10 +421,12 @@ class ClaudeForecaster(BedrockModelInterface):
 class TitanForecaster(BedrockModelInterface):
     """Amazon Titan-based forecasting implementation framework."""
     
+    __slots__ = ('model_id', 'bedrock_client')
+    
     def __init__(self, model_id: str = "amazon.titan-text-premier-v1:0"):
         """Initialize Titan forecaster."""
         self.model_id = model_id
-        self.bedrock_client = None
+        self.bedrock_client = None  # Will be initialized when needed
     
     def generate_forecast(self, request: BedrockForecastRequest) -> BedrockForecastResponse:
         """Generate forecast using Titan."""
@@ -278,7 +441,7 @@ class TitanForecaster(BedrockModelInterface):
             model_explanation="Titan-based analysis indicates stable growth",
             risk_assessment={"volatility_level": "low", "confidence_score": 0.8},
             market_insights=["Stable market conditions", "Low volatility expected"],
-            timestamp=datetime.now()
+            timestamp=request.requested_at or _now()
         )
     
     def explain_prediction(self, prediction_data: Dict[str, Any]) -> str:
@@ -297,13 +460,27 @@ class TitanForecaster(BedrockModelInterface):
 class BedrockForecastingEngine:
     """Main engine for Bedrock-powered forecasting."""
     
-    def __init__(self):
+    __slots__ = (
+        'models', 'default_model', '_generate', 'cache_size', '_response_cache', '_cache_lock'
+    )
+    
+    # Number of trailing closes hashed into the response cache key
+    CACHE_KEY_WINDOW = 64
+    
+    def __init__(self, cache_size: int = 1024):
         """Initialize Bedrock forecasting engine."""
         self.models = {
             'claude': ClaudeForecaster(),
             'titan': TitanForecaster()
         }
         self.default_model = 'claude'
+        # Bound generate_forecast per model, so dispatch is a single dict lookup
+        self._generate = {name: model.generate_forecast for name, model in self.models.items()}
+        
+        # Exact-match LRU of responses so repeated dashboard requests skip the model call
+        self.cache_size = cache_size
+        self._response_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         
     def forecast_with_bedrock(
         self, 
@@ -311,14 +488,111 @@ class BedrockForecastingEngine:
         historical_data: List[Dict[str, Any]], 
         horizon: int = 30,
         model_name: str = None,
-        parameters: Dict[str, Any] = None
+        parameters: Dict[str, Any] = None,
+        now: Optional[datetime] = None
     ) -> BedrockForecastResponse:
         """Generate forecast using Bedrock models."""
+        request = self._prepare_request(symbol, historical_data, horizon, model_name, parameters, now)
+        return self._run_request(request)
+    
+    def _run_request(self, request: BedrockForecastRequest) -> BedrockForecastResponse:
+        """Answer a prepared request from the cache or its model."""
+        key = self._cache_key(request)
+        cached = self._cache_get(key, request.requested_at or _now())
+        if cached is not None:
+            return cached
         
+        response = self._generate[request.model_id](request)
+        self._cache_put(key, response)
+        return response
+    
+    async def forecast_with_bedrock_async(
+        self, 
+        symbol: str, 
+        historical_data: List[Dict[str, Any]], 
+        horizon: int = 30,
+        model_name: str = None,
+        parameters: Dict[str, Any] = None,
+        now: Optional[datetime] = None
+    ) -> BedrockForecastResponse:
+        """Generate forecast using Bedrock models without blocking the event loop."""
+        request = self._prepare_request(symbol, historical_data, horizon, model_name, parameters, now)
+        return await self._run_request_async(request)
+    
+    async def _run_request_async(self, request: BedrockForecastRequest) -> BedrockForecastResponse:
+        """Answer a prepared request from the cache or its model without blocking."""
+        key = self._cache_key(request)
+        cached = self._cache_get(key, request.requested_at or _now())
+        if cached is not None:
+            return cached
+        
+        response = await self.models[request.model_id].generate_forecast_async(request)
+        self._cache_put(key, response)
+        return response
+    
+    def _cache_key(self, request: BedrockForecastRequest) -> tuple:
+        """Build the response cache key for a forecast request."""
+        data = request.historical_data
+        if request.closes is not None:
+            closes = request.closes[-self.CACHE_KEY_WINDOW:]
+        else:
+            closes = array('d', (float(d.get('close', 0.0)) for d in data[-self.CACHE_KEY_WINDOW:]))
+        digest = hashlib.blake2b(closes.tobytes(), digest_size=16).digest()
+        
+        return (
+            request.model_id,
+            request.symbol,
+            request.forecast_horizon,
+            json.dumps(dict(request.parameters), sort_keys=True, default=str),
+            len(data),
+            data[0].get('date') if data else None,
+            data[-1].get('date') if data else None,
+            digest
+        )
+    
+    def _cache_get(self, key: tuple, timestamp: datetime) -> Optional[BedrockForecastResponse]:
+        """Return a copy of a cached response stamped with timestamp, marking it recently used."""
+        with self._cache_lock:
+            response = self._response_cache.get(key)
+            if response is None:
+                return None
+            self._response_cache.move_to_end(key)
+        
+        # The key ignores the request time, so each hit gets its own timestamp and
+        # a private copy that callers may mutate without touching the cache
+        return replace(copy.deepcopy(response), timestamp=timestamp)
+    
+    def _cache_put(self, key: tuple, response: BedrockForecastResponse):
+        """Store a response, evicting the least recently used entries."""
+        if self.cache_size <= 0:
+            return
+        
+        response = copy.deepcopy(response)
+        with self._cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached forecast responses."""
+        with self._cache_lock:
+            self._response_cache.clear()
+    
+    def _prepare_request(
+        self, 
+        symbol: str, 
+        historical_data: List[Dict[str, Any]], 
+        horizon: int,
+        model_name: Optional[str],
+        parameters: Optional[Dict[str, Any]],
+        now: Optional[datetime] = None
+    ) -> BedrockForecastRequest:
+        """Resolve the model name and build the forecast request."""
         model_name = model_name or self.default_model
         parameters = parameters or self._get_default_parameters()
         
-        if model_name not in self.models:
+        if model_name not in self._generate:
             raise ForecastingError(f"Unknown model: {model_name}")
         
         request = BedrockForecastRequest(
@@ -327,19 +601,27 @@ class BedrockForecastingEngine:
             forecast_horizon=horizon,
             model_id=model_name,
             parameters=parameters,
-            context=self._build_context(symbol, historical_data)
+            context=self._build_context(symbol, historical_data),
+            closes=_extract_closes(historical_data) if NUMPY_AVAILABLE else None,
+            requested_at=now
         )
         
-        model = self.models[model_name]
-        return model.generate_forecast(request)
+        return request
     
-    def _get_default_parameters(self) -> Dict[str, Any]:
-        """Get default parameters for Bedrock models."""
-        return {
-            'max_tokens': 4000,
-            'temperature': 0.1,
-            'top_p': 0.9
-        }
+    def _prepare_shared_request(
+        self, 
+        symbol: str, 
+        historical_data: List[Dict[str, Any]], 
+        horizon: int
+    ) -> BedrockForecastRequest:
+        """Build one request whose context, closes and summary every model can reuse."""
+        request = self._prepare_request(symbol, historical_data, horizon, None, None, _now())
+        request.historical_summary = _summarize_history(historical_data, request.closes)
+        return request
+    
+    def _get_default_parameters(self) -> Mapping[str, Any]:
+        """Get default parameters for Bedrock models (shared, read-only)."""
+        return _DEFAULT_PARAMETERS
     
     def _build_context(self, symbol: str, historical_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Build context information for the model."""
@@ -350,44 +632,70 @@ class BedrockForecastingEngine:
                 'start': historical_data[0].get('date') if historical_data else None,
                 'end': historical_data[-1].get('date') if historical_data else None
             },
-            'market_type': 'commodity' if symbol.lower() in ['gold', 'silver'] else 'equity'
+            'market_type': 'commodity' if symbol.casefold() in _COMMODITY_SYMBOLS else 'equity'
         }
     
-    def get_model_capabilities(self) -> Dict[str, Any]:
-        """Get capabilities of available Bedrock models."""
-        return {
-            'claude': {
-                'strengths': ['Complex reasoning', 'Detailed explanations', 'Risk assessment'],
-                'use_cases': ['Long-term forecasting', 'Market analysis', 'Risk evaluation'],
-                'max_horizon': 365
-            },
-            'titan': {
-                'strengths': ['Fast inference', 'Stable predictions', 'Cost-effective'],
-                'use_cases': ['Short-term forecasting', 'Real-time predictions', 'Batch processing'],
-                'max_horizon': 90
-            }
-        }
+    def get_model_capabilities(self) -> Mapping[str, Any]:
+        """Get capabilities of available Bedrock models (shared, read-only)."""
+        return _MODEL_CAPABILITIES
     
     def compare_model_predictions(
         self, 
         symbol: str, 
         historical_data: List[Dict[str, Any]], 
-        horizon: int = 30
+        horizon: int = 30,
+        timeout: Optional[float] = None
     ) -> Dict[str, BedrockForecastResponse]:
-        """Compare predictions from multiple Bedrock models."""
+        """Compare predictions from multiple Bedrock models, querying them in parallel."""
         results = {}
+        base_request = self._prepare_shared_request(symbol, historical_data, horizon)
         
-        for model_name in self.models.keys():
-            try:
-                results[model_name] = self.forecast_with_bedrock(
-                    symbol=symbol,
-                    historical_data=historical_data,
-                    horizon=horizon,
-                    model_name=model_name
+        # Bedrock calls are I/O-bound, so one thread per model overlaps their latency
+        executor = ThreadPoolExecutor(max_workers=len(self.models))
+        try:
+            futures = {
+                model_name: executor.submit(
+                    self._run_request, replace(base_request, model_id=model_name)
                 )
-            except Exception as e:
-                app_logger.error(f"Model {model_name} failed: {str(e)}")
+                for model_name in self.models.keys()
+            }
+            
+            for model_name, future in futures.items():
+                try:
+                    results[model_name] = future.result(timeout=timeout)
+                except Exception as e:
+                    app_logger.error(f"Model {model_name} failed: {str(e)}")
+                    results[model_name] = None
+        finally:
+            # Don't block on calls that already timed out
+            executor.shutdown(wait=False)
+        
+        return results
+    
+    async def compare_model_predictions_async(
+        self, 
+        symbol: str, 
+        historical_data: List[Dict[str, Any]], 
+        horizon: int = 30
+    ) -> Dict[str, BedrockForecastResponse]:
+        """Compare predictions from multiple Bedrock models, querying them concurrently."""
+        model_names = list(self.models.keys())
+        base_request = self._prepare_shared_request(symbol, historical_data, horizon)
+        responses = await asyncio.gather(
+            *(
+                self._run_request_async(replace(base_request, model_id=model_name))
+                for model_name in model_names
+            ),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for model_name, response in zip(model_names, responses):
+            if isinstance(response, Exception):
+                app_logger.error(f"Model {model_name} failed: {str(response)}")
                 results[model_name] = None
+            else:
+                results[model_name] = response
         
         return results
 
@@ -395,6 +703,11 @@ class BedrockForecastingEngine:
 class BedrockMarketInsights:
     """Generate market insights using Bedrock models."""
     
+    __slots__ = ('forecasting_engine',)
+    
+    # Upper bound on concurrent Bedrock calls when building a report synchronously
+    MAX_WORKERS = 8
+    
     def __init__(self, forecasting_engine: BedrockForecastingEngine):
         """Initialize market insights generator."""
         self.forecasting_engine = forecasting_engine
@@ -405,38 +718,112 @@ class BedrockMarketInsights:
         market_data: Dict[str, List[Dict[str, Any]]]
     ) -> Dict[str, Any]:
         """Generate comprehensive market report using Bedrock."""
+        batch_timestamp = _now()
+        report = self._new_report(batch_timestamp)
+        
+        # Framework implementation: Bedrock calls are I/O-bound, so fan them out
+        symbols = [symbol for symbol in symbols if symbol in market_data]
+        if symbols:
+            with ThreadPoolExecutor(max_workers=min(len(symbols), self.MAX_WORKERS)) as executor:
+                forecasts = list(executor.map(
+                    lambda symbol: self.forecasting_engine.forecast_with_bedrock(
+                        symbol=symbol,
+                        historical_data=market_data[symbol],
+                        horizon=30,
+                        now=batch_timestamp
+                    ),
+                    symbols
+                ))
+            report['symbol_analysis'] = self._analyze_forecasts(symbols, forecasts)
         
-        report = {
-            'executive_summary': '',
-            'symbol_analysis': {},
-            'market_outlook': {},
-            'risk_assessment': {},
-            'recommendations': [],
-            'generated_at': datetime.now().isoformat()
-        }
+        # Generate executive summary using Bedrock
+        report['executive_summary'] = self._generate_executive_summary(report['symbol_analysis'])
         
-        # Framework implementation
-        for symbol in symbols:
-            if symbol in market_data:
-                forecast = self.forecasting_engine.forecast_with_bedrock(
+        return report
+    
+    async def generate_market_report_async(
+        self, 
+        symbols: List[str], 
+        market_data: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Generate market report, forecasting all symbols concurrently."""
+        batch_timestamp = _now()
+        report = self._new_report(batch_timestamp)
+        
+        symbols = [symbol for symbol in symbols if symbol in market_data]
+        forecasts = await asyncio.gather(
+            *(
+                self.forecasting_engine.forecast_with_bedrock_async(
                     symbol=symbol,
                     historical_data=market_data[symbol],
-                    horizon=30
+                    horizon=30,
+                    now=batch_timestamp
                 )
-                
-                report['symbol_analysis'][symbol] = {
-                    'forecast': forecast.to_dict(),
-                    'trend': self._analyze_trend(forecast.predictions),
-                    'volatility': forecast.risk_assessment.get('volatility_level', 'unknown')
-                }
+                for symbol in symbols
+            ),
+            return_exceptions=True
+        )
+        
+        succeeded = []
+        for symbol, forecast in zip(symbols, forecasts):
+            if isinstance(forecast, Exception):
+                app_logger.error(f"Bedrock forecast for {symbol} failed: {str(forecast)}")
+                continue
+            succeeded.append((symbol, forecast))
+        
+        if succeeded:
+            report['symbol_analysis'] = self._analyze_forecasts(*zip(*succeeded))
         
-        # Generate executive summary using Bedrock
         report['executive_summary'] = self._generate_executive_summary(report['symbol_analysis'])
         
         return report
     
-    def _analyze_trend(self, predictions: List[float]) -> str:
+    def _new_report(self, generated_at: datetime) -> Dict[str, Any]:
+        """Create an empty market report."""
+        return {
+            'executive_summary': '',
+            'symbol_analysis': {},
+            'market_outlook': {},
+            'risk_assessment': {},
+            'recommendations': [],
+            'generated_at': generated_at.isoformat()
+        }
+    
+    def _analyze_forecasts(
+        self, 
+        symbols: List[str], 
+        forecasts: List[BedrockForecastResponse]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Build per-symbol analysis entries, classifying all trends in one batch."""
+        if NUMPY_AVAILABLE:
+            n = len(forecasts)
+            counts = np.fromiter((len(f.predictions) for f in forecasts), dtype=np.int64, count=n)
+            first = np.fromiter(
+                (f.predictions[0] if f.predictions else 0.0 for f in forecasts),
+                dtype=np.float64, count=n
+            )
+            last = np.fromiter(
+                (f.predictions[-1] if f.predictions else 0.0 for f in forecasts),
+                dtype=np.float64, count=n
+            )
+            trends = [_TREND_LABELS[code] for code in trend_codes(first, last, counts)]
+        else:
+            trends = [self._analyze_trend(f.predictions) for f in forecasts]
+        
+        return {
+            symbol: {
+                'forecast': forecast.to_dict(),
+                'trend': trend,
+                'volatility': forecast.risk_assessment.get('volatility_level', 'unknown')
+            }
+            for symbol, forecast, trend in zip(symbols, forecasts, trends)
+        }
+    
+    def _analyze_trend(self, predictions: Union[List[float], 'np.ndarray']) -> str:
         """Analyze trend from predictions."""
+        if NUMPY_AVAILABLE:
+            return _TREND_LABELS[trend_code(np.asarray(predictions, dtype=np.float64))]
+        
         if len(predictions) < 2:
             return 'insufficient_data'
         
@@ -457,6 +844,8 @@ class BedrockMarketInsights:
 class HybridForecastingEngine:
     """Hybrid engine combining traditional models with Bedrock."""
     
+    __slots__ = ('traditional_engine', 'bedrock_engine')
+    
     def __init__(self, traditional_engine, bedrock_engine: BedrockForecastingEngine):
         """Initialize hybrid engine."""
         self.traditional_engine = traditional_engine
@@ -502,11 +891,25 @@ class HybridForecastingEngine:
     
     def _create_ensemble_forecast(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Create ensemble forecast from multiple models."""
-        # Framework implementation for combining forecasts
+        weights = {'traditional': 0.4, 'bedrock': 0.6}
+        final_predictions = []
+        
+        traditional = results.get('traditional_forecast')
+        bedrock = results.get('bedrock_forecast')
+        if NUMPY_AVAILABLE and isinstance(traditional, dict) and isinstance(bedrock, dict):
+            a = np.asarray(traditional.get('predictions', []), dtype=np.float64)
+            b = np.asarray(bedrock.get('predictions', []), dtype=np.float64)
+            n = min(a.shape[0], b.shape[0])
+            if n:
+                a, b = a[:n], b[:n]
+                out = np.empty_like(a)
+                weighted_average(a, b, weights['traditional'], weights['bedrock'], out)
+                final_predictions = out.tolist()
+        
         return {
             'method': 'weighted_average',
-            'weights': {'traditional': 0.4, 'bedrock': 0.6},
-            'final_predictions': [],
+            'weights': weights,
+            'final_predictions': final_predictions,
             'confidence_score': 0.8
         }
 
@@ -515,25 +918,27 @@ class HybridForecastingEngine:
 class BedrockConfig:
     """Configuration for Bedrock integration."""
     
+    __slots__ = ('aws_region', 'model_configs')
+    
     def __init__(self):
         """Initialize Bedrock configuration."""
         self.aws_region = "us-east-1"  # Default region
         self.model_configs = {
-            'claude': {
+            'claude': MappingProxyType({
                 'model_id': 'anthropic.claude-3-sonnet-20240229-v1:0',
                 'max_tokens': 4000,
                 'temperature': 0.1
-            },
-            'titan': {
+            }),
+            'titan': MappingProxyType({
                 'model_id': 'amazon.titan-text-premier-v1:0',
                 'max_tokens': 3000,
                 'temperature': 0.2
-            }
+            })
         }
     
-    def get_model_config(self, model_name: str) -> Dict[str, Any]:
-        """Get configuration for specific model."""
-        return self.model_configs.get(model_name, {})
+    def get_model_config(self, model_name: str) -> Mapping[str, Any]:
+        """Get configuration for specific model (read-only)."""
+        return self.model_configs.get(model_name, _EMPTY_MAPPING)
     
     def validate_aws_credentials(self) -> bool:
         """Validate AWS credentials (framework)."""
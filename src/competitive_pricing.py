@@ -1,16 +1,30 @@
 """Competitive Pricing Intelligence module for AI Retail Intelligence Platform."""
 
 import os
+import copy
+import functools
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-from src.config import settings
+from src.config import get_settings
 from src.exceptions import DataLoadingError, PricingEngineError
 from src.logger import app_logger
 
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 @dataclass
 class PriceComparison:
@@ -53,12 +67,23 @@ class CompetitivePricingEngine:
     
     def __init__(self, data_dir: str = None):
         """Initialize competitive pricing engine."""
-        self.data_dir = data_dir or settings.data_dir
+        self.data_dir = data_dir or get_settings().data_dir
         self.platforms = [
             'Amazon', 'Flipkart', 'JioMart', 
             'Blinkit', 'Zepto', 'DMart_Ready'
         ]
+        self._platform_cols = [platform.lower() for platform in self.platforms]
+        self._col_to_platform = dict(zip(self._platform_cols, self.platforms))
         self.pricing_data = None
+        self._platform_summary = None
+        self._comparison_cache = {}
+        self._product_groups = {}
+        self._latest = None
+        self._price_cols = []
+        self._price_matrix = None
+        self._latest_prices = None
+        self._products_unique = None
+        self._product_list = []
         self.load_pricing_data()
     
     def load_pricing_data(self):
@@ -70,55 +95,146 @@ class CompetitivePricingEngine:
                 app_logger.warning(f"Competitive pricing CSV not found: {csv_path}")
                 return
             
-            self.pricing_data = pd.read_csv(csv_path)
+            parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+            
+            cached = None
+            if PYARROW_AVAILABLE and self._parquet_is_fresh(parquet_path, csv_path):
+                cached = pd.read_parquet(parquet_path)
+                # Caches written when prices were stored as float32 have lost their cents
+                if (cached.dtypes.reindex(self._platform_cols) == np.float32).any():
+                    cached = None
+            
+            if cached is not None:
+                self.pricing_data = cached
+            else:
+                # Declare dtypes up front and parse dates during the read
+                dtypes = dict.fromkeys(self._platform_cols, 'float64')
+                dtypes.update({'product_id': 'category', 'product_name': 'category'})
+                
+                self.pricing_data = pd.read_csv(
+                    csv_path,
+                    engine='pyarrow' if PYARROW_AVAILABLE else 'c',
+                    dtype=dtypes,
+                    parse_dates=['date']
+                )
+                
+                if PYARROW_AVAILABLE:
+                    self._write_parquet_cache(parquet_path)
             
-            # Convert date column to datetime
-            if 'date' in self.pricing_data.columns:
-                self.pricing_data['date'] = pd.to_datetime(self.pricing_data['date'])
+            self._platform_summary = None
+            self._comparison_cache = {}
+            self._build_product_index()
             
             app_logger.info(f"Loaded competitive pricing data: {len(self.pricing_data)} records")
             
         except Exception as e:
             app_logger.error(f"Failed to load competitive pricing data: {str(e)}")
             self.pricing_data = None
+            self._platform_summary = None
+            self._comparison_cache = {}
+            self._product_groups = {}
+            self._latest = None
+            self._price_cols = []
+            self._price_matrix = None
+            self._latest_prices = None
+            self._products_unique = None
+            self._product_list = []
+    
+    @staticmethod
+    def _parquet_is_fresh(parquet_path: str, csv_path: str) -> bool:
+        """Check whether the Parquet copy exists and is at least as new as the CSV."""
+        return (
+            os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+        )
+    
+    def _write_parquet_cache(self, parquet_path: str):
+        """Persist the parsed pricing data next to the CSV for faster reloads."""
+        try:
+            self.pricing_data.to_parquet(parquet_path, index=False, compression='snappy')
+        except Exception as e:
+            app_logger.warning(f"Could not write Parquet cache {parquet_path}: {str(e)}")
+    
+    def _build_product_index(self):
+        """Precompute per-product slices and latest rows so lookups skip full-table scans."""
+        # Sort once so every product occupies a contiguous, date-ordered block of rows
+        data = self.pricing_data.sort_values(['product_id', 'date'], kind='stable').reset_index(drop=True)
+        self.pricing_data = data
+        
+        ids = data['product_id']
+        starts = np.flatnonzero(ids.ne(ids.shift()).to_numpy())
+        ends = np.append(starts[1:], len(data))[:len(starts)]
+        self._product_groups = {
+            ids.iat[start]: data.iloc[start:end] for start, end in zip(starts, ends)
+        }
+        
+        # Contiguous float64 block of every platform price, row-aligned with pricing_data
+        self._price_cols = [col for col in self._platform_cols if col in data.columns]
+        self._price_matrix = data[self._price_cols].to_numpy(dtype=np.float64)
+        
+        # First row on each product's most recent date, keyed by product_id
+        dates = data['date'].to_numpy()
+        group_ids = np.repeat(np.arange(len(starts)), ends - starts)
+        on_last_date = np.flatnonzero(dates == dates[ends - 1][group_ids])
+        _, first = np.unique(group_ids[on_last_date], return_index=True)
+        latest_rows = on_last_date[first]
+        
+        self._latest = data.iloc[latest_rows].set_index('product_id', drop=False)
+        self._latest_prices = self._price_matrix[latest_rows]
+        
+        # Deduplicated product table with lowercased names for substring search
+        products = data[['product_id', 'product_name']].drop_duplicates().reset_index(drop=True)
+        products['_lower'] = products['product_name'].str.lower()
+        self._products_unique = products
+        self._product_list = products[['product_id', 'product_name']].to_dict('records')
     
-    def compare_prices(self, product_id: str) -> Optional[PriceComparison]:
+    def compare_prices(self, product_id: str, include_trends: bool = True) -> Optional[PriceComparison]:
         """Compare prices across platforms for a specific product."""
+        cache_key = (product_id, include_trends)
+        comparison = self._comparison_cache.get(cache_key)
+        if comparison is None:
+            comparison = self._build_comparison(product_id, include_trends)
+            if comparison is not None:
+                self._comparison_cache[cache_key] = comparison
+        
+        if comparison is None:
+            return None
+        
+        # Only the computed fields are reused: each call gets its own copy, stamped now
+        return replace(copy.deepcopy(comparison), analysis_timestamp=datetime.now())
+    
+    def _build_comparison(self, product_id: str, include_trends: bool = True) -> Optional[PriceComparison]:
+        """Run the price comparison for a product against the loaded data."""
         try:
             if self.pricing_data is None:
                 raise PricingEngineError("Pricing data not loaded")
             
-            # Filter data for the specific product
-            product_data = self.pricing_data[
-                self.pricing_data['product_id'] == product_id
-            ].copy()
+            # Look up the precomputed slice for the specific product
+            product_data = self._product_groups.get(product_id)
             
-            if product_data.empty:
+            if product_data is None or product_data.empty:
                 app_logger.warning(f"No data found for product_id: {product_id}")
                 return None
             
-            # Get the most recent data for current prices
-            latest_date = product_data['date'].max()
-            current_data = product_data[product_data['date'] == latest_date]
+            # Most recent row for current prices
+            current_data = self._latest.loc[[product_id]]
             
-            if current_data.empty:
-                return None
+            # Current prices as one row aligned with self.platforms (missing columns -> NaN)
+            row = current_data.reindex(columns=self._platform_cols).to_numpy(dtype=np.float64)[0]
+            valid = ~np.isnan(row) & (row > 0)
             
-            # Extract current prices for each platform
-            current_prices = {}
-            for platform in self.platforms:
-                platform_col = platform.lower().replace('_', '_')
-                if platform_col in current_data.columns:
-                    price = current_data[platform_col].iloc[0]
-                    if pd.notna(price) and price > 0:
-                        current_prices[platform] = float(price)
-            
-            if not current_prices:
+            if not valid.any():
                 return None
             
             # Find lowest and highest prices
-            lowest_platform = min(current_prices, key=current_prices.get)
-            highest_platform = max(current_prices, key=current_prices.get)
+            lowest_idx = int(np.argmin(np.where(valid, row, np.inf)))
+            highest_idx = int(np.argmax(np.where(valid, row, -np.inf)))
+            
+            current_prices = {
+                self.platforms[i]: float(row[i]) for i in np.flatnonzero(valid)
+            }
+            lowest_platform = self.platforms[lowest_idx]
+            highest_platform = self.platforms[highest_idx]
             lowest_price = current_prices[lowest_platform]
             highest_price = current_prices[highest_platform]
             
@@ -129,12 +245,17 @@ class CompetitivePricingEngine:
             # Generate recommendation
             recommendation = f"Buy from {lowest_platform} to save ₹{savings_amount:.2f} ({price_diff_pct:.1f}%)"
             
-            # Calculate trends
-            trend_7_days = self._calculate_trend(product_data, 7)
-            trend_30_days = self._calculate_trend(product_data, 30)
+            # Calculate trends for both windows in one pass, unless the caller only needs prices
+            if include_trends:
+                trends = self._calculate_trends_batch(product_data, (7, 30))
+                trend_7_days = trends[7]
+                trend_30_days = trends[30]
+            else:
+                trend_7_days = {}
+                trend_30_days = {}
             
             # Get product name
-            product_name = current_data['product_name'].iloc[0] if 'product_name' in current_data.columns else product_id
+            product_name = current_data['product_name'].to_numpy()[0] if 'product_name' in current_data.columns else product_id
             
             return PriceComparison(
                 product_id=product_id,
@@ -158,30 +279,47 @@ class CompetitivePricingEngine:
     
     def _calculate_trend(self, product_data: pd.DataFrame, days: int) -> Dict[str, float]:
         """Calculate price trends over specified number of days."""
+        return self._calculate_trends_batch(product_data, (days,))[days]
+    
+    def _calculate_trends_batch(
+        self, 
+        product_data: pd.DataFrame, 
+        windows: Tuple[int, ...] = (7, 30)
+    ) -> Dict[int, Dict[str, float]]:
+        """Calculate price trends for several day windows from a date-sorted product slice."""
         try:
-            cutoff_date = product_data['date'].max() - timedelta(days=days)
-            trend_data = product_data[product_data['date'] >= cutoff_date]
-            
-            trends = {}
-            for platform in self.platforms:
-                platform_col = platform.lower().replace('_', '_')
-                if platform_col in trend_data.columns:
-                    platform_prices = trend_data[platform_col].dropna()
+            dates = product_data['date'].to_numpy()
+            max_date = dates.max()
+            
+            columns = [
+                (platform, col) for platform, col in zip(self.platforms, self._platform_cols)
+                if col in product_data.columns
+            ]
+            prices = product_data[[col for _, col in columns]].to_numpy(dtype=np.float64)
+            
+            results = {}
+            for days in windows:
+                window = prices[dates >= max_date - np.timedelta64(days, 'D')]
+                
+                trends = {}
+                for j, (platform, _) in enumerate(columns):
+                    platform_prices = window[:, j]
+                    platform_prices = platform_prices[~np.isnan(platform_prices)]
                     
-                    if len(platform_prices) >= 2:
-                        # Calculate percentage change from first to last
-                        first_price = platform_prices.iloc[0]
-                        last_price = platform_prices.iloc[-1]
-                        
+                    if platform_prices.size >= 2:
+                        first_price, last_price = platform_prices[0], platform_prices[-1]
                         if first_price > 0:
+                            # Calculate percentage change from first to last
                             trend_pct = ((last_price - first_price) / first_price) * 100
-                            trends[platform] = round(trend_pct, 2)
+                            trends[platform] = round(float(trend_pct), 2)
+                
+                results[days] = trends
             
-            return trends
+            return results
             
         except Exception as e:
             app_logger.error(f"Trend calculation failed: {str(e)}")
-            return {}
+            return {days: {} for days in windows}
     
     def get_product_list(self) -> List[Dict[str, str]]:
         """Get list of available products."""
@@ -189,8 +327,7 @@ class CompetitivePricingEngine:
             if self.pricing_data is None:
                 return []
             
-            products = self.pricing_data[['product_id', 'product_name']].drop_duplicates()
-            return products.to_dict('records')
+            return list(self._product_list)
             
         except Exception as e:
             app_logger.error(f"Failed to get product list: {str(e)}")
@@ -202,13 +339,11 @@ class CompetitivePricingEngine:
             if self.pricing_data is None:
                 return []
             
-            # Case-insensitive search
-            mask = self.pricing_data['product_name'].str.contains(
-                query, case=False, na=False
-            )
+            # Case-insensitive search over the small deduplicated product table
+            products = self._products_unique
+            mask = products['_lower'].str.contains(query.lower(), regex=False, na=False)
             
-            products = self.pricing_data[mask][['product_id', 'product_name']].drop_duplicates()
-            return products.to_dict('records')
+            return products.loc[mask, ['product_id', 'product_name']].to_dict('records')
             
         except Exception as e:
             app_logger.error(f"Product search failed: {str(e)}")
@@ -220,6 +355,9 @@ class CompetitivePricingEngine:
             if self.pricing_data is None:
                 return {}
             
+            if self._platform_summary is not None:
+                return self._platform_summary
+            
             summary = {
                 'total_products': len(self.pricing_data['product_id'].unique()),
                 'platforms': self.platforms,
@@ -230,20 +368,19 @@ class CompetitivePricingEngine:
                 'platform_stats': {}
             }
             
-            # Calculate stats for each platform
-            for platform in self.platforms:
-                platform_col = platform.lower().replace('_', '_')
-                if platform_col in self.pricing_data.columns:
-                    platform_prices = self.pricing_data[platform_col].dropna()
-                    
-                    if len(platform_prices) > 0:
-                        summary['platform_stats'][platform] = {
-                            'avg_price': float(platform_prices.mean()),
-                            'min_price': float(platform_prices.min()),
-                            'max_price': float(platform_prices.max()),
-                            'total_listings': len(platform_prices)
-                        }
-            
+            # Reduce each platform column of the cached price matrix
+            for col, platform_prices in zip(self._price_cols, self._price_matrix.T):
+                platform_prices = platform_prices[~np.isnan(platform_prices)]
+                
+                if platform_prices.size > 0:
+                    summary['platform_stats'][self._col_to_platform[col]] = {
+                        'avg_price': float(platform_prices.mean()),
+                        'min_price': float(platform_prices.min()),
+                        'max_price': float(platform_prices.max()),
+                        'total_listings': int(platform_prices.size)
+                    }
+            
+            self._platform_summary = summary
             return summary
             
         except Exception as e:
@@ -256,35 +393,50 @@ class CompetitivePricingEngine:
             if self.pricing_data is None:
                 return []
             
-            deals = []
-            products = self.pricing_data['product_id'].unique()
-            
-            for product_id in products[:limit]:  # Limit for performance
-                comparison = self.compare_prices(product_id)
-                if comparison and comparison.savings_amount > 0:
-                    deals.append({
-                        'product_id': comparison.product_id,
-                        'product_name': comparison.product_name,
-                        'savings_amount': comparison.savings_amount,
-                        'savings_percentage': comparison.price_difference_percentage,
-                        'lowest_platform': comparison.lowest_platform,
-                        'lowest_price': comparison.lowest_price,
-                        'highest_price': comparison.highest_price
-                    })
-            
-            # Sort by savings amount (descending)
-            deals.sort(key=lambda x: x['savings_amount'], reverse=True)
-            return deals[:limit]
+            if not self._price_cols:
+                return []
+            
+            # Latest price block with non-positive prices masked out
+            prices = self._latest_prices
+            prices = np.where(prices > 0, prices, np.nan)
+            has_price = ~np.isnan(prices).all(axis=1)
+            latest, prices = self._latest[has_price], prices[has_price]
+            
+            if prices.size == 0:
+                return []
+            
+            lowest = np.nanmin(prices, axis=1)
+            highest = np.nanmax(prices, axis=1)
+            platform_names = np.array([self._col_to_platform[col] for col in self._price_cols])
+            names = latest['product_name'] if 'product_name' in latest.columns else latest['product_id']
+            
+            deals = pd.DataFrame({
+                'product_id': latest['product_id'].to_numpy(),
+                'product_name': names.to_numpy(),
+                'savings_amount': highest - lowest,
+                'savings_percentage': (highest - lowest) / lowest * 100,
+                'lowest_platform': platform_names[np.nanargmin(prices, axis=1)],
+                'lowest_price': lowest,
+                'highest_price': highest
+            })
+            deals = deals[deals['savings_amount'] > 0]
+            
+            return deals.nlargest(limit, 'savings_amount').to_dict('records')
             
         except Exception as e:
             app_logger.error(f"Best deals calculation failed: {str(e)}")
             return []
 
 
+@functools.lru_cache(maxsize=1)
+def _get_engine() -> CompetitivePricingEngine:
+    """Shared engine for the standalone helpers, so the CSV is read only once."""
+    return CompetitivePricingEngine()
+
+
 def compare_prices(product_id: str) -> Optional[Dict[str, Any]]:
     """Standalone function for price comparison."""
-    engine = CompetitivePricingEngine()
-    result = engine.compare_prices(product_id)
+    result = _get_engine().compare_prices(product_id)
     return result.to_dict() if result else None
 
 
@@ -295,6 +447,36 @@ class CompetitivePricingCopilot:
     def __init__(self, pricing_engine: CompetitivePricingEngine):
         """Initialize with pricing engine."""
         self.pricing_engine = pricing_engine
+        self._name_matcher = self._build_name_matcher()
+    
+    def _build_name_matcher(self):
+        """Build an Aho-Corasick automaton over lowercased product names, if available."""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        try:
+            products = self.pricing_engine.get_product_list()
+            if not products:
+                return None
+            
+            automaton = ahocorasick.Automaton()
+            for product in products:
+                name = product['product_name'].lower()
+                automaton.add_word(name, (len(name), product['product_id']))
+            automaton.make_automaton()
+            return automaton
+            
+        except Exception as e:
+            app_logger.warning(f"Product name matcher unavailable: {str(e)}")
+            return None
+    
+    def _match_product_name(self, query_lower: str) -> Optional[str]:
+        """Return the product_id of the longest product name found in the query."""
+        if self._name_matcher is None:
+            return None
+        
+        matches = [value for _, value in self._name_matcher.iter(query_lower)]
+        return max(matches)[1] if matches else None
     
     def process_pricing_query(self, query: str) -> str:
         """Process pricing-related queries."""
@@ -303,6 +485,13 @@ class CompetitivePricingCopilot:
         try:
             # Extract product name or ID from query
             if 'compare' in query_lower or 'price' in query_lower:
+                # Whole product names found in a single scan of the query
+                product_id = self._match_product_name(query_lower)
+                if product_id is not None:
+                    comparison = self.pricing_engine.compare_prices(product_id)
+                    if comparison:
+                        return self._format_comparison_response(comparison)
+                
                 # Simple keyword extraction
                 words = query.split()
                 
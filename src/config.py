@@ -1,8 +1,9 @@
 """Configuration management for AI Retail Intelligence Platform."""
 
 import os
+import functools
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
@@ -18,6 +19,7 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0", description="API host")
     api_port: int = Field(default=8000, description="API port")
     api_prefix: str = Field(default="/api/v1", description="API prefix")
+    admin_token: Optional[str] = Field(default=None, description="Token required by debug endpoints")
     
     # Data Settings
     data_dir: str = Field(default="data", description="Data directory path")
@@ -40,10 +42,18 @@ class Settings(BaseSettings):
     rate_limit_requests: int = Field(default=100, description="Requests per minute")
     rate_limit_window: int = Field(default=60, description="Rate limit window in seconds")
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        frozen=True
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading .env and the environment only once."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
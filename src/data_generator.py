@@ -1,12 +1,104 @@
 """Generate realistic sample data for AI Retail Intelligence Platform."""
 
-import csv
-import random
-import math
-from datetime import datetime, timedelta
-from typing import List, Tuple
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
 import os
 
+import numpy as np
+import pandas as pd
+
+
+def _sample_ohlc_noise(n, change_range, vol_lo, vol_hi, open_spread,
+                       volume_lo, volume_hi, seed):
+    """Draw every random variate the OHLC simulation needs in a few batched calls."""
+    rng = np.random.default_rng(seed)
+    
+    daily_change = rng.uniform(-change_range, change_range, n)
+    daily_vol = rng.uniform(vol_lo, vol_hi, n)
+    open_mul = rng.uniform(1 - open_spread, 1 + open_spread, n)
+    high_mul = rng.uniform(1.0, 1.0 + daily_vol)
+    low_mul = rng.uniform(1.0 - daily_vol, 1.0)
+    volume_base = rng.uniform(volume_lo, volume_hi, n)
+    
+    return daily_change, open_mul, high_mul, low_mul, volume_base
+
+
+def _gen_ohlc(initial, trend_total, prev_trend_total, seasonal_amp, volume_mul,
+              daily_change, open_mul, high_mul, low_mul, volume_base):
+    """Simulate OHLCV data with trend and seasonality from pre-sampled daily noise."""
+    n = daily_change.shape[0]
+    days = np.arange(n)
+    
+    # Add trend and seasonality
+    trend_factor = 1 + (trend_total * days / n)
+    seasonal_factor = 1 + seasonal_amp * np.sin(2 * np.pi * days / 365.25)
+    prev_trend = np.ones(n)
+    prev_trend[1:] = 1 + (prev_trend_total * days[:-1] / n)
+    
+    # The daily price recurrence is a running product of per-day factors
+    factors = (1 + daily_change) * trend_factor * seasonal_factor / prev_trend
+    price = initial * np.cumprod(factors)
+    
+    # Generate OHLC data
+    closes = np.round(price, 2)
+    opens = np.round(closes * open_mul, 2)
+    highs = np.round(np.maximum(opens, closes) * high_mul, 2)
+    lows = np.round(np.minimum(opens, closes) * low_mul, 2)
+    
+    # Volume (higher volume on higher volatility days)
+    volumes = (volume_base * (1 + np.abs(daily_change) * volume_mul)).astype(np.int64)
+    
+    return opens, highs, lows, closes, volumes
+
+
+def _date_strings(start_date: str, end_date: str) -> np.ndarray:
+    """Daily YYYY-MM-DD strings from start_date through end_date inclusive."""
+    return pd.date_range(start_date, end_date, freq='D').strftime('%Y-%m-%d').to_numpy()
+
+
+def _ohlc_columns(date_strs: np.ndarray, ohlc) -> Dict[str, np.ndarray]:
+    """Pair the arrays returned by _gen_ohlc with their column names."""
+    opens, highs, lows, closes, volumes = ohlc
+    return {
+        'date': date_strs,
+        'open': opens,
+        'high': highs,
+        'low': lows,
+        'close': closes,
+        'volume': volumes
+    }
+
+
+def _gen_one_etf(etf_info: Dict, date_strs: np.ndarray) -> Dict[str, np.ndarray]:
+    """Simulate the OHLCV columns for a single ETF over the given dates."""
+    symbol = etf_info['symbol']
+    volatility = etf_info['volatility']
+    
+    # ETF trends follow market patterns
+    if 'GOLD' in symbol:
+        trend_total = 0.25  # Gold ETF follows gold
+    elif 'BANK' in symbol:
+        trend_total = 0.35  # Banking sector growth
+    else:
+        trend_total = 0.30  # General market growth
+    
+    noise = _sample_ohlc_noise(
+        len(date_strs),
+        volatility * 2,
+        0.005, 0.03,
+        0.002,
+        10000, 100000,
+        zlib.crc32(symbol.encode()) % 1000  # Consistent seed per ETF
+    )
+    ohlc = _gen_ohlc(
+        etf_info['initial_price'],
+        trend_total, 0.30,
+        0.03, 20.0,
+        *noise
+    )
+    return _ohlc_columns(date_strs, ohlc)
+
 
 class SampleDataGenerator:
     """Generate realistic sample datasets for testing and demonstration."""
@@ -19,128 +111,69 @@ class SampleDataGenerator:
     def generate_gold_prices(self, 
                            start_date: str = "2020-01-01",
                            end_date: str = "2024-01-01",
-                           initial_price: float = 1800.0) -> List[dict]:
+                           initial_price: float = 1800.0) -> Dict[str, np.ndarray]:
         """Generate realistic gold price data."""
         
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        
         # Generate date range
-        current_date = start
-        dates = []
-        while current_date <= end:
-            dates.append(current_date)
-            current_date += timedelta(days=1)
-        
-        n_days = len(dates)
-        
-        # Generate price movements with realistic patterns
-        random.seed(42)  # For reproducible data
-        
-        data = []
-        current_price = initial_price
-        
-        for i, date in enumerate(dates):
-            # Add trend and seasonality
-            trend_factor = 1 + (0.3 * i / n_days)  # 30% increase over period
-            seasonal_factor = 1 + 0.05 * math.sin(2 * math.pi * i / 365.25)
-            
-            # Random daily movement
-            daily_change = random.uniform(-0.03, 0.03)  # ±3% daily change
-            current_price *= (1 + daily_change) * trend_factor * seasonal_factor / (1 + (0.3 * (i-1) / n_days) if i > 0 else 1)
-            
-            # Generate OHLC data
-            close = round(current_price, 2)
-            daily_vol = random.uniform(0.005, 0.025)  # 0.5% to 2.5% daily range
-            
-            # Open price (close to previous close with some gap)
-            open_price = round(close * random.uniform(0.995, 1.005), 2)
-            
-            # High and low based on open and close
-            high = round(max(open_price, close) * random.uniform(1.0, 1.0 + daily_vol), 2)
-            low = round(min(open_price, close) * random.uniform(1.0 - daily_vol, 1.0), 2)
-            
-            # Volume (higher volume on higher volatility days)
-            volume = int(random.uniform(50000, 200000) * (1 + abs(daily_change) * 10))
-            
-            data.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'open': open_price,
-                'high': high,
-                'low': low,
-                'close': close,
-                'volume': volume
-            })
-        
-        print(f"Generated {len(data)} gold price records")
+        date_strs = _date_strings(start_date, end_date)
+        n_days = len(date_strs)
+        
+        # Generate price movements with realistic patterns (fixed seed for reproducible data)
+        noise = _sample_ohlc_noise(
+            n_days,
+            0.03,            # ±3% daily change
+            0.005, 0.025,    # 0.5% to 2.5% daily range
+            0.005,           # open within ±0.5% of close
+            50000, 200000,
+            42
+        )
+        ohlc = _gen_ohlc(
+            initial_price,
+            0.3, 0.3,        # 30% increase over period
+            0.05, 10.0,      # seasonal amplitude, volume sensitivity
+            *noise
+        )
+        data = _ohlc_columns(date_strs, ohlc)
+        
+        print(f"Generated {n_days} gold price records")
         return data
     
     def generate_silver_prices(self,
                              start_date: str = "2020-01-01", 
                              end_date: str = "2024-01-01",
-                             initial_price: float = 25.0) -> List[dict]:
+                             initial_price: float = 25.0) -> Dict[str, np.ndarray]:
         """Generate realistic silver price data."""
         
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        
-        current_date = start
-        dates = []
-        while current_date <= end:
-            dates.append(current_date)
-            current_date += timedelta(days=1)
-        
-        n_days = len(dates)
-        
-        random.seed(43)  # Different seed for silver
-        
-        data = []
-        current_price = initial_price
-        
-        for i, date in enumerate(dates):
-            # Silver is more volatile than gold
-            trend_factor = 1 + (0.4 * i / n_days)  # 40% increase over period
-            seasonal_factor = 1 + 0.08 * math.sin(2 * math.pi * i / 365.25)
-            
-            daily_change = random.uniform(-0.05, 0.05)  # ±5% daily change (more volatile)
-            current_price *= (1 + daily_change) * trend_factor * seasonal_factor / (1 + (0.4 * (i-1) / n_days) if i > 0 else 1)
-            
-            close = round(current_price, 2)
-            daily_vol = random.uniform(0.01, 0.04)  # Higher volatility than gold
-            
-            open_price = round(close * random.uniform(0.99, 1.01), 2)
-            high = round(max(open_price, close) * random.uniform(1.0, 1.0 + daily_vol), 2)
-            low = round(min(open_price, close) * random.uniform(1.0 - daily_vol, 1.0), 2)
-            
-            volume = int(random.uniform(100000, 500000) * (1 + abs(daily_change) * 15))
-            
-            data.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'open': open_price,
-                'high': high,
-                'low': low,
-                'close': close,
-                'volume': volume
-            })
-        
-        print(f"Generated {len(data)} silver price records")
+        date_strs = _date_strings(start_date, end_date)
+        n_days = len(date_strs)
+        
+        # Silver is more volatile than gold
+        noise = _sample_ohlc_noise(
+            n_days,
+            0.05,            # ±5% daily change
+            0.01, 0.04,      # higher daily range than gold
+            0.01,
+            100000, 500000,
+            43  # Different seed for silver
+        )
+        ohlc = _gen_ohlc(
+            initial_price,
+            0.4, 0.4,        # 40% increase over period
+            0.08, 15.0,
+            *noise
+        )
+        data = _ohlc_columns(date_strs, ohlc)
+        
+        print(f"Generated {n_days} silver price records")
         return data
     
     def generate_etf_prices(self,
                           start_date: str = "2020-01-01",
-                          end_date: str = "2024-01-01") -> List[dict]:
+                          end_date: str = "2024-01-01") -> Dict[str, np.ndarray]:
         """Generate realistic Indian ETF price data."""
         
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        
-        current_date = start
-        dates = []
-        while current_date <= end:
-            dates.append(current_date)
-            current_date += timedelta(days=1)
-        
-        n_days = len(dates)
+        date_strs = _date_strings(start_date, end_date)
+        n_days = len(date_strs)
         
         # Generate data for multiple popular Indian ETFs
         etfs = [
@@ -150,50 +183,17 @@ class SampleDataGenerator:
             {'symbol': 'JUNIORBEES', 'initial_price': 250.0, 'volatility': 0.022}
         ]
         
-        all_data = []
+        # Each ETF series is independent, so generate them concurrently
+        with ThreadPoolExecutor(max_workers=len(etfs)) as executor:
+            per_etf = list(executor.map(lambda etf_info: _gen_one_etf(etf_info, date_strs), etfs))
         
-        for etf_info in etfs:
-            random.seed(hash(etf_info['symbol']) % 1000)  # Consistent seed per ETF
-            
-            symbol = etf_info['symbol']
-            initial_price = etf_info['initial_price']
-            volatility = etf_info['volatility']
-            current_price = initial_price
-            
-            for i, date in enumerate(dates):
-                # ETF trends follow market patterns
-                if 'GOLD' in symbol:
-                    trend_factor = 1 + (0.25 * i / n_days)  # Gold ETF follows gold
-                elif 'BANK' in symbol:
-                    trend_factor = 1 + (0.35 * i / n_days)  # Banking sector growth
-                else:
-                    trend_factor = 1 + (0.30 * i / n_days)  # General market growth
-                
-                seasonal_factor = 1 + 0.03 * math.sin(2 * math.pi * i / 365.25)
-                daily_change = random.uniform(-volatility*2, volatility*2)
-                
-                current_price *= (1 + daily_change) * trend_factor * seasonal_factor / (1 + (0.30 * (i-1) / n_days) if i > 0 else 1)
-                
-                close = round(current_price, 2)
-                daily_vol = random.uniform(0.005, 0.03)
-                
-                open_price = round(close * random.uniform(0.998, 1.002), 2)
-                high = round(max(open_price, close) * random.uniform(1.0, 1.0 + daily_vol), 2)
-                low = round(min(open_price, close) * random.uniform(1.0 - daily_vol, 1.0), 2)
-                
-                volume = int(random.uniform(10000, 100000) * (1 + abs(daily_change) * 20))
-                
-                all_data.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'symbol': symbol,
-                    'open': open_price,
-                    'high': high,
-                    'low': low,
-                    'close': close,
-                    'volume': volume
-                })
+        # Stack the per-ETF columns, with a symbol column repeated per day
+        all_data = {'date': np.concatenate([etf['date'] for etf in per_etf])}
+        all_data['symbol'] = np.repeat([etf_info['symbol'] for etf_info in etfs], n_days)
+        for column in ('open', 'high', 'low', 'close', 'volume'):
+            all_data[column] = np.concatenate([etf[column] for etf in per_etf])
         
-        print(f"Generated {len(all_data)} ETF price records for {len(etfs)} ETFs")
+        print(f"Generated {len(all_data['date'])} ETF price records for {len(etfs)} ETFs")
         return all_data
     
     def save_all_datasets(self):
@@ -202,28 +202,19 @@ class SampleDataGenerator:
         # Generate gold prices
         gold_data = self.generate_gold_prices()
         gold_path = os.path.join(self.data_dir, "gold_prices.csv")
-        with open(gold_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['date', 'open', 'high', 'low', 'close', 'volume'])
-            writer.writeheader()
-            writer.writerows(gold_data)
+        pd.DataFrame(gold_data).to_csv(gold_path, index=False, float_format='%.2f')
         print(f"Saved gold prices to {gold_path}")
         
         # Generate silver prices
         silver_data = self.generate_silver_prices()
         silver_path = os.path.join(self.data_dir, "silver_prices.csv")
-        with open(silver_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['date', 'open', 'high', 'low', 'close', 'volume'])
-            writer.writeheader()
-            writer.writerows(silver_data)
+        pd.DataFrame(silver_data).to_csv(silver_path, index=False, float_format='%.2f')
         print(f"Saved silver prices to {silver_path}")
         
         # Generate ETF prices
         etf_data = self.generate_etf_prices()
         etf_path = os.path.join(self.data_dir, "etf_prices.csv")
-        with open(etf_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['date', 'symbol', 'open', 'high', 'low', 'close', 'volume'])
-            writer.writeheader()
-            writer.writerows(etf_data)
+        pd.DataFrame(etf_data).to_csv(etf_path, index=False, float_format='%.2f')
         print(f"Saved ETF prices to {etf_path}")
         
         return {
@@ -1,6 +1,8 @@
 """Data loading and preprocessing for AI Retail Intelligence Platform."""
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -10,6 +12,36 @@ from dataclasses import dataclass
 from src.config import settings
 from src.exceptions import DataLoadingError, DataValidationError
 from src.logger import app_logger
+from src._numba_kernels import compute_indicators
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+
+# Price columns in the order the validation and indicator code expects them
+_PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+# Storage dtype for OHLC prices; float32 cannot hold larger prices to the cent
+_PRICE_DTYPE = np.float64
+
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_US_DATE_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$')
 
 
 @dataclass
@@ -43,7 +75,8 @@ class PriceDataValidator:
         """Validate DataFrame structure and content."""
         try:
             # Check required columns
-            missing_columns = set(required_columns) - set(df.columns)
+            have = set(df.columns)
+            missing_columns = set(required_columns) - have
             if missing_columns:
                 raise DataValidationError(f"Missing required columns: {missing_columns}")
             
@@ -52,21 +85,27 @@ class PriceDataValidator:
                 raise DataValidationError("DataFrame is empty")
             
             # Check for null values in critical columns
-            price_columns = ['open', 'high', 'low', 'close']
+            price_columns = [col for col in _PRICE_COLUMNS if col in have]
             for col in price_columns:
-                if col in df.columns and df[col].isnull().any():
+                if df[col].hasnans:
                     app_logger.warning(f"Found null values in {col} column")
             
             # Validate price relationships
-            if all(col in df.columns for col in price_columns):
-                invalid_rows = ~(
-                    (df['high'] >= df['low']) &
-                    (df['high'] >= df['open']) &
-                    (df['high'] >= df['close']) &
-                    (df['low'] <= df['open']) &
-                    (df['low'] <= df['close']) &
-                    (df[price_columns] > 0).all(axis=1)
-                )
+            if len(price_columns) == len(_PRICE_COLUMNS):
+                # One contiguous N x 4 float block; NaN fails every comparison, as before
+                prices = df[price_columns].to_numpy(dtype=_PRICE_DTYPE)
+                o, h, l, c = prices[:, 0], prices[:, 1], prices[:, 2], prices[:, 3]
+                if NUMEXPR_AVAILABLE:
+                    invalid_rows = ne.evaluate(
+                        '~((h >= l) & (h >= o) & (h >= c) & (l <= o) & (l <= c)'
+                        ' & (o > 0) & (h > 0) & (l > 0) & (c > 0))'
+                    )
+                else:
+                    invalid_rows = ~(
+                        (h >= np.maximum(l, np.maximum(o, c))) &
+                        (l <= np.minimum(o, c)) &
+                        (prices > 0).all(axis=1)
+                    )
                 
                 if invalid_rows.any():
                     app_logger.warning(f"Found {invalid_rows.sum()} rows with invalid price relationships")
@@ -77,6 +116,20 @@ class PriceDataValidator:
         except Exception as e:
             raise DataValidationError(f"Data validation failed: {str(e)}")
     
+    @staticmethod
+    def _detect_date_format(dates: pd.Series) -> Optional[str]:
+        """Guess the strftime format of a string date column from its first value."""
+        sample = dates.dropna()
+        if sample.empty:
+            return None
+        
+        sample = str(sample.iloc[0]).strip()
+        if _ISO_DATE_RE.match(sample):
+            return '%Y-%m-%d'
+        if _US_DATE_RE.match(sample):
+            return '%m/%d/%Y'
+        return None
+    
     @staticmethod
     def validate_date_column(df: pd.DataFrame, date_column: str = 'date') -> pd.DataFrame:
         """Validate and convert date column."""
@@ -84,17 +137,28 @@ class PriceDataValidator:
             if date_column not in df.columns:
                 raise DataValidationError(f"Date column '{date_column}' not found")
             
-            # Convert to datetime
-            df[date_column] = pd.to_datetime(df[date_column])
+            # Convert to datetime, using an explicit format when one can be sniffed
+            if not pd.api.types.is_datetime64_any_dtype(df[date_column]):
+                date_format = PriceDataValidator._detect_date_format(df[date_column])
+                df[date_column] = pd.to_datetime(
+                    df[date_column], format=date_format, cache=True, errors='raise'
+                )
+            
+            dates = df[date_column]
+            
+            if dates.is_monotonic_increasing:
+                # Already sorted: duplicates can only be adjacent
+                values = dates.to_numpy()
+                if (values[1:] == values[:-1]).any():
+                    app_logger.warning("Found duplicate dates in data")
+                return df.reset_index(drop=True)
             
             # Check for duplicate dates
-            if df[date_column].duplicated().any():
+            if not dates.is_unique:
                 app_logger.warning("Found duplicate dates in data")
             
             # Sort by date
-            df = df.sort_values(date_column).reset_index(drop=True)
-            
-            return df
+            return df.sort_values(date_column, kind='stable', ignore_index=True)
             
         except Exception as e:
             raise DataValidationError(f"Date validation failed: {str(e)}")
@@ -104,64 +168,139 @@ class DataPreprocessor:
     """Handles data cleaning, normalization, and feature engineering."""
     
     @staticmethod
-    def clean_data(df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and preprocess price data."""
+    def _fill_gaps(values: np.ndarray) -> np.ndarray:
+        """Forward fill NaNs, then backward fill any that lead the array."""
+        missing = np.isnan(values)
+        if not missing.any():
+            return values
+        
+        positions = np.arange(len(values))
+        
+        # Index of the most recent valid value at or before each position
+        source = np.where(missing, 0, positions)
+        np.maximum.accumulate(source, out=source)
+        values = values[source]
+        
+        # Index of the next valid value for whatever is still missing
+        missing = np.isnan(values)
+        if missing.any():
+            source = np.where(missing, len(values) - 1, positions)
+            source = np.minimum.accumulate(source[::-1])[::-1]
+            values = values[source]
+        
+        return values
+    
+    @staticmethod
+    def drop_duplicate_dates(df: pd.DataFrame) -> pd.DataFrame:
+        """Keep the last row per date (per date and symbol for multi-symbol data)."""
+        if 'date' not in df.columns:
+            return df.drop_duplicates()
+        
+        if 'symbol' in df.columns:
+            return df.drop_duplicates(subset=['date', 'symbol'], keep='last')
+        
+        dates = df['date']
+        if not dates.is_monotonic_increasing:
+            return df.drop_duplicates(subset=['date'], keep='last')
+        
+        # Sorted dates: a row survives unless the next row repeats its date
+        values = dates.to_numpy()
+        keep = np.append(values[1:] != values[:-1], True) if len(values) else np.ones(0, dtype=bool)
+        return df if keep.all() else df[keep]
+    
+    @staticmethod
+    def clean_columns(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Fill missing prices and drop empty rows in column-array form."""
         try:
-            # Remove duplicates
-            df = df.drop_duplicates()
+            columns = dict(columns)
             
-            # Handle missing values
-            price_columns = ['open', 'high', 'low', 'close']
-            for col in price_columns:
-                if col in df.columns:
-                    # Forward fill missing values
-                    df[col] = df[col].fillna(method='ffill')
-                    # Backward fill remaining missing values
-                    df[col] = df[col].fillna(method='bfill')
+            # Handle missing values: forward fill, then backward fill what remains
+            for col in _PRICE_COLUMNS:
+                if col in columns:
+                    columns[col] = DataPreprocessor._fill_gaps(
+                        np.asarray(columns[col], dtype=_PRICE_DTYPE)
+                    )
             
             # Remove rows with all NaN values
-            df = df.dropna(how='all')
+            if columns:
+                empty = np.logical_and.reduce([pd.isna(values) for values in columns.values()])
+                if empty.any():
+                    keep = ~empty
+                    columns = {col: values[keep] for col, values in columns.items()}
             
-            return df
+            return columns
             
         except Exception as e:
             raise DataLoadingError(f"Data cleaning failed: {str(e)}")
     
     @staticmethod
-    def add_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
-        """Add technical indicators for analysis."""
+    def clean_data(df: pd.DataFrame) -> pd.DataFrame:
+        """Clean and preprocess price data."""
         try:
-            if 'close' not in df.columns:
-                return df
-            
-            # Moving averages
-            df['ma_7'] = df['close'].rolling(window=7).mean()
-            df['ma_30'] = df['close'].rolling(window=30).mean()
-            
-            # Volatility (rolling standard deviation)
-            df['volatility'] = df['close'].rolling(window=30).std()
+            # Remove duplicates
+            df = DataPreprocessor.drop_duplicate_dates(df)
             
-            # Price change
-            df['price_change'] = df['close'].pct_change()
+            columns = {col: df[col].to_numpy() for col in df.columns}
+            return pd.DataFrame(DataPreprocessor.clean_columns(columns), copy=False)
             
-            # Daily range
-            if all(col in df.columns for col in ['high', 'low']):
-                df['daily_range'] = df['high'] - df['low']
-                df['daily_range_pct'] = df['daily_range'] / df['close']
+        except DataLoadingError:
+            raise
+        except Exception as e:
+            raise DataLoadingError(f"Data cleaning failed: {str(e)}")
+    
+    @staticmethod
+    def indicator_columns(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Compute technical indicator arrays from close (and high/low when present)."""
+        try:
+            if 'close' not in columns:
+                return {}
+            
+            close = np.asarray(columns['close'], dtype=_PRICE_DTYPE)
+            has_range = 'high' in columns and 'low' in columns
+            high = np.asarray(columns['high'], dtype=_PRICE_DTYPE) if has_range else close
+            low = np.asarray(columns['low'], dtype=_PRICE_DTYPE) if has_range else close
+            
+            # Moving averages, volatility (rolling std), price change and daily range in one pass
+            ma_7, ma_30, volatility, price_change, daily_range, daily_range_pct = \
+                compute_indicators(close, high, low, 7, 30)
+            
+            indicators = {
+                'ma_7': ma_7,
+                'ma_30': ma_30,
+                'volatility': volatility,
+                'price_change': price_change
+            }
+            if has_range:
+                indicators['daily_range'] = daily_range
+                indicators['daily_range_pct'] = daily_range_pct
             
-            return df
+            return indicators
             
         except Exception as e:
             app_logger.warning(f"Failed to add technical indicators: {str(e)}")
-            return df
+            return {}
+    
+    @staticmethod
+    def add_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
+        """Add technical indicators for analysis."""
+        columns = {col: df[col].to_numpy() for col in ('close', 'high', 'low') if col in df.columns}
+        indicators = DataPreprocessor.indicator_columns(columns)
+        return df.assign(**indicators) if indicators else df
     
     @staticmethod
     def normalize_data(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
         """Normalize specified columns."""
         try:
-            for col in columns:
-                if col in df.columns:
-                    df[f'{col}_normalized'] = (df[col] - df[col].mean()) / df[col].std()
+            cols = [col for col in columns if col in df.columns]
+            if not cols:
+                return df
+            
+            # Z-score every column at once over a single 2D block (NaNs skipped, as in pandas)
+            values = df[cols].to_numpy(dtype=np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                mean = np.nanmean(values, axis=0)
+                std = np.nanstd(values, axis=0, ddof=1)
+                df[[f'{col}_normalized' for col in cols]] = (values - mean) / std
             
             return df
             
@@ -173,98 +312,139 @@ class DataPreprocessor:
 class DataLoader:
     """Main class for loading and preprocessing CSV data."""
     
+    # Default file name and log label per asset type
+    _PRICE_FILES = {
+        'GOLD': ('gold_prices.csv', 'Gold'),
+        'SILVER': ('silver_prices.csv', 'Silver'),
+        'ETF': ('etf_prices.csv', 'ETF')
+    }
+    
+    # Asset files that carry a per-row symbol column of their own
+    _MULTI_SYMBOL = frozenset({'ETF'})
+    
+    # Final column dtypes for the pandas CSV fallback, so the C parser skips inference
+    _CSV_DTYPES = {
+        'open': 'float64',
+        'high': 'float64',
+        'low': 'float64',
+        'close': 'float64',
+        'volume': 'Int64'
+    }
+    
     def __init__(self, data_dir: str = None):
         """Initialize DataLoader with data directory."""
         self.data_dir = data_dir or settings.data_dir
         self.validator = PriceDataValidator()
         self.preprocessor = DataPreprocessor()
+        self.cache_dir = os.path.join(self.data_dir, ".cache")
         
         # Ensure data directory exists
         os.makedirs(self.data_dir, exist_ok=True)
         
         app_logger.info(f"DataLoader initialized with data directory: {self.data_dir}")
     
-    def load_gold_prices(self, file_path: str = None) -> pd.DataFrame:
-        """Load gold price data from CSV file."""
+    @staticmethod
+    def _stat_or_raise(file_path: str, label: str) -> os.stat_result:
+        """Stat a source file once, turning a missing file into a DataLoadingError."""
         try:
-            file_path = file_path or os.path.join(self.data_dir, "gold_prices.csv")
-            
-            if not os.path.exists(file_path):
-                raise DataLoadingError(f"Gold price file not found: {file_path}")
-            
-            app_logger.info(f"Loading gold price data from: {file_path}")
-            
-            df = pd.read_csv(file_path)
-            
-            # Standardize column names
-            df.columns = df.columns.str.lower().str.strip()
-            
-            # Validate required columns
-            required_columns = ['date', 'open', 'high', 'low', 'close']
-            self.validator.validate_dataframe(df, required_columns)
-            
-            # Validate and convert date column
-            df = self.validator.validate_date_column(df)
-            
-            # Clean and preprocess data
-            df = self.preprocessor.clean_data(df)
-            df = self.preprocessor.add_technical_indicators(df)
-            
-            # Add symbol column
-            df['symbol'] = 'GOLD'
-            
-            app_logger.info(f"Successfully loaded {len(df)} gold price records")
-            return df
-            
+            return os.stat(file_path)
+        except FileNotFoundError:
+            raise DataLoadingError(f"{label} price file not found: {file_path}")
+    
+    def _processed_cache_path(self, file_path: str, stat: os.stat_result) -> str:
+        """Parquet cache location for a CSV, keyed by its modification time and size."""
+        name = f"{os.path.basename(file_path)}.{stat.st_mtime:.0f}.{stat.st_size}.parquet"
+        return os.path.join(self.cache_dir, name)
+    
+    def _read_processed_cache(self, file_path: str, stat: os.stat_result) -> Optional[pd.DataFrame]:
+        """Return previously preprocessed data for a CSV, if a current cache entry exists."""
+        if not PYARROW_AVAILABLE:
+            return None
+        
+        cache_path = self._processed_cache_path(file_path, stat)
+        try:
+            return pd.read_parquet(cache_path, engine='pyarrow')
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            raise DataLoadingError(f"Failed to load gold prices: {str(e)}")
+            app_logger.warning(f"Ignoring unreadable cache {cache_path}: {str(e)}")
+            return None
     
-    def load_silver_prices(self, file_path: str = None) -> pd.DataFrame:
-        """Load silver price data from CSV file."""
+    def _write_processed_cache(self, file_path: str, stat: os.stat_result, df: pd.DataFrame):
+        """Persist preprocessed data for a CSV so later loads skip parsing and indicators."""
+        if not PYARROW_AVAILABLE:
+            return
+        
         try:
-            file_path = file_path or os.path.join(self.data_dir, "silver_prices.csv")
-            
-            if not os.path.exists(file_path):
-                raise DataLoadingError(f"Silver price file not found: {file_path}")
-            
-            app_logger.info(f"Loading silver price data from: {file_path}")
-            
-            df = pd.read_csv(file_path)
-            
-            # Standardize column names
-            df.columns = df.columns.str.lower().str.strip()
-            
-            # Validate required columns
-            required_columns = ['date', 'open', 'high', 'low', 'close']
-            self.validator.validate_dataframe(df, required_columns)
-            
-            # Validate and convert date column
-            df = self.validator.validate_date_column(df)
-            
-            # Clean and preprocess data
-            df = self.preprocessor.clean_data(df)
-            df = self.preprocessor.add_technical_indicators(df)
-            
-            # Add symbol column
-            df['symbol'] = 'SILVER'
-            
-            app_logger.info(f"Successfully loaded {len(df)} silver price records")
-            return df
-            
+            os.makedirs(self.cache_dir, exist_ok=True)
+            df.to_parquet(
+                self._processed_cache_path(file_path, stat),
+                engine='pyarrow',
+                compression='snappy',
+                index=False
+            )
         except Exception as e:
-            raise DataLoadingError(f"Failed to load silver prices: {str(e)}")
+            app_logger.warning(f"Could not cache preprocessed data for {file_path}: {str(e)}")
     
-    def load_etf_prices(self, file_path: str = None) -> pd.DataFrame:
-        """Load ETF price data from CSV file."""
+    def _read_csv_fast(self, file_path: str) -> pd.DataFrame:
+        """Read a price CSV with the fastest available engine (PyArrow, Polars, then pandas)."""
+        if PYARROW_AVAILABLE:
+            try:
+                # Declared types let Arrow skip inference for the known price columns
+                column_types = {
+                    'date': pa.timestamp('ns'),
+                    'open': pa.float64(),
+                    'high': pa.float64(),
+                    'low': pa.float64(),
+                    'close': pa.float64(),
+                    'volume': pa.int64()
+                }
+                table = pa_csv.read_csv(
+                    file_path,
+                    read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20),
+                    convert_options=pa_csv.ConvertOptions(column_types=column_types)
+                )
+                return table.to_pandas(self_destruct=True)
+            except Exception as e:
+                app_logger.debug(f"PyArrow CSV read failed for {file_path}, falling back: {str(e)}")
+        
+        if POLARS_AVAILABLE:
+            try:
+                return pl.read_csv(file_path, try_parse_dates=True).to_pandas()
+            except Exception as e:
+                app_logger.debug(f"Polars CSV read failed for {file_path}, falling back: {str(e)}")
+        
         try:
-            file_path = file_path or os.path.join(self.data_dir, "etf_prices.csv")
+            return pd.read_csv(
+                file_path,
+                dtype=self._CSV_DTYPES,
+                parse_dates=['date'],
+                date_format='%Y-%m-%d',
+                engine='c',
+                memory_map=True
+            )
+        except (ValueError, TypeError) as e:
+            # Non-standard headers or values: let pandas infer, validation runs afterwards
+            app_logger.debug(f"Typed CSV read failed for {file_path}, falling back: {str(e)}")
+            return pd.read_csv(file_path)
+    
+    def _load_prices(self, symbol: str, file_path: str = None) -> pd.DataFrame:
+        """Load, validate and preprocess a price CSV for one asset type."""
+        default_file, label = self._PRICE_FILES[symbol]
+        
+        try:
+            file_path = file_path or os.path.join(self.data_dir, default_file)
+            
+            stat = self._stat_or_raise(file_path, label)
             
-            if not os.path.exists(file_path):
-                raise DataLoadingError(f"ETF price file not found: {file_path}")
+            app_logger.info(f"Loading {label} price data from: {file_path}")
             
-            app_logger.info(f"Loading ETF price data from: {file_path}")
+            df = self._read_processed_cache(file_path, stat)
+            if df is not None:
+                app_logger.info(f"Loaded {len(df)} {label} price records from cache")
+                return df
             
-            df = pd.read_csv(file_path)
+            df = self._read_csv_fast(file_path)
             
             # Standardize column names
             df.columns = df.columns.str.lower().str.strip()
@@ -276,19 +456,39 @@ class DataLoader:
             # Validate and convert date column
             df = self.validator.validate_date_column(df)
             
-            # Clean and preprocess data
-            df = self.preprocessor.clean_data(df)
-            df = self.preprocessor.add_technical_indicators(df)
+            # Remove duplicates
+            df = self.preprocessor.drop_duplicate_dates(df)
+            
+            # Clean and preprocess as plain column arrays, building the DataFrame once
+            columns = {col: df[col].to_numpy() for col in df.columns}
+            columns = self.preprocessor.clean_columns(columns)
+            columns.update(self.preprocessor.indicator_columns(columns))
+            
+            # Add symbol column (multi-symbol files keep their own)
+            if symbol not in self._MULTI_SYMBOL or 'symbol' not in columns:
+                columns['symbol'] = np.full(len(columns['date']), symbol, dtype=object)
+            
+            df = pd.DataFrame(columns, copy=False)
             
-            # Add symbol column if not present
-            if 'symbol' not in df.columns:
-                df['symbol'] = 'ETF'
+            self._write_processed_cache(file_path, stat, df)
             
-            app_logger.info(f"Successfully loaded {len(df)} ETF price records")
+            app_logger.info(f"Successfully loaded {len(df)} {label} price records")
             return df
             
         except Exception as e:
-            raise DataLoadingError(f"Failed to load ETF prices: {str(e)}")
+            raise DataLoadingError(f"Failed to load {label} prices: {str(e)}")
+    
+    def load_gold_prices(self, file_path: str = None) -> pd.DataFrame:
+        """Load gold price data from CSV file."""
+        return self._load_prices('GOLD', file_path)
+    
+    def load_silver_prices(self, file_path: str = None) -> pd.DataFrame:
+        """Load silver price data from CSV file."""
+        return self._load_prices('SILVER', file_path)
+    
+    def load_etf_prices(self, file_path: str = None) -> pd.DataFrame:
+        """Load ETF price data from CSV file."""
+        return self._load_prices('ETF', file_path)
     
     def validate_price_data(self, data: pd.DataFrame) -> bool:
         """Validate price data format and integrity."""
@@ -303,12 +503,14 @@ class DataLoader:
         """Preprocess data with cleaning and feature engineering."""
         try:
             # Clean data
-            data = self.preprocessor.clean_data(data)
+            data = self.preprocessor.drop_duplicate_dates(data)
+            columns = {col: data[col].to_numpy() for col in data.columns}
+            columns = self.preprocessor.clean_columns(columns)
             
             # Add technical indicators
-            data = self.preprocessor.add_technical_indicators(data)
+            columns.update(self.preprocessor.indicator_columns(columns))
             
-            return data
+            return pd.DataFrame(columns, copy=False)
             
         except Exception as e:
             raise DataLoadingError(f"Data preprocessing failed: {str(e)}")
@@ -316,46 +518,82 @@ class DataLoader:
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
         """Load all available price data."""
         data = {}
+        loaders = [
+            ('gold', 'gold', self.load_gold_prices),
+            ('silver', 'silver', self.load_silver_prices),
+            ('etf', 'ETF', self.load_etf_prices)
+        ]
         
-        try:
-            data['gold'] = self.load_gold_prices()
-        except DataLoadingError as e:
-            app_logger.warning(f"Could not load gold data: {str(e)}")
-        
-        try:
-            data['silver'] = self.load_silver_prices()
-        except DataLoadingError as e:
-            app_logger.warning(f"Could not load silver data: {str(e)}")
-        
-        try:
-            data['etf'] = self.load_etf_prices()
-        except DataLoadingError as e:
-            app_logger.warning(f"Could not load ETF data: {str(e)}")
+        # Assets load independently; PyArrow parsing and the indicator kernel release the GIL
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = [(key, label, executor.submit(loader)) for key, label, loader in loaders]
+            
+            for key, label, future in futures:
+                try:
+                    data[key] = future.result()
+                except DataLoadingError as e:
+                    app_logger.warning(f"Could not load {label} data: {str(e)}")
         
         app_logger.info(f"Loaded data for {len(data)} asset types")
         return data
     
+    def load_all_data_lazy(self) -> Dict[str, Any]:
+        """Return Polars LazyFrames for all available price data.
+        
+        Every frame is the validated, cleaned and indicator-enriched data that
+        load_all_data returns: preprocessed Parquet cache entries are scanned
+        directly, and a missing entry is produced by the eager loader first, so
+        callers can chain filters/projections and collect once.
+        """
+        if not POLARS_AVAILABLE:
+            raise DataLoadingError("Lazy loading requires polars to be installed")
+        
+        frames = {}
+        for key, symbol in (('gold', 'GOLD'), ('silver', 'SILVER'), ('etf', 'ETF')):
+            default_file, label = self._PRICE_FILES[symbol]
+            file_path = os.path.join(self.data_dir, default_file)
+            
+            try:
+                stat = self._stat_or_raise(file_path, label)
+                cache_path = self._processed_cache_path(file_path, stat)
+                
+                if not os.path.exists(cache_path):
+                    # Preprocess eagerly; this also writes the cache entry when PyArrow is available
+                    df = self._load_prices(symbol, file_path)
+                    if not os.path.exists(cache_path):
+                        frames[key] = pl.from_pandas(df).lazy()
+                        continue
+                
+                frames[key] = pl.scan_parquet(cache_path)
+            except DataLoadingError as e:
+                app_logger.warning(f"Could not load {label} data: {str(e)}")
+        
+        return frames
+    
     def get_data_summary(self, data: pd.DataFrame) -> Dict[str, Any]:
         """Get summary statistics for price data."""
         try:
+            have = set(data.columns)
+            has_date = 'date' in have
+            
             summary = {
                 'total_records': len(data),
                 'date_range': {
-                    'start': data['date'].min().strftime('%Y-%m-%d') if 'date' in data.columns else None,
-                    'end': data['date'].max().strftime('%Y-%m-%d') if 'date' in data.columns else None
+                    'start': data['date'].min().strftime('%Y-%m-%d') if has_date else None,
+                    'end': data['date'].max().strftime('%Y-%m-%d') if has_date else None
                 },
                 'price_statistics': {}
             }
             
-            price_columns = ['open', 'high', 'low', 'close']
-            for col in price_columns:
-                if col in data.columns:
-                    summary['price_statistics'][col] = {
-                        'mean': float(data[col].mean()),
-                        'std': float(data[col].std()),
-                        'min': float(data[col].min()),
-                        'max': float(data[col].max())
-                    }
+            cols = [col for col in _PRICE_COLUMNS if col in have]
+            
+            if cols:
+                # One aggregate over all price columns
+                stats = data[cols].agg(['mean', 'std', 'min', 'max']).to_dict()
+                summary['price_statistics'] = {
+                    col: {stat: float(value) for stat, value in stats[col].items()}
+                    for col in cols
+                }
             
             return summary
             
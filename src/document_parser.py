@@ -2,7 +2,9 @@
 
 import os
 import re
+import functools
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass
@@ -11,6 +13,94 @@ from enum import Enum
 from src.exceptions import DocumentParsingError, LLMServiceError
 from src.config import settings
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Engine for the entity patterns: RE2's linear-time automaton when installed,
+# otherwise the stdlib backtracking engine. Patterns stay within the syntax
+# both accept (no lookarounds or backreferences; inline flags only).
+_entity_re = re2 if RE2_AVAILABLE else re
+
+# Entity patterns used by MockLLMService.extract_entities, compiled once at import
+_COMPANY_PATTERNS = [
+    _entity_re.compile(r'\b([A-Z][a-z]+ (?:Inc\.|Corp\.|Ltd\.|Company))\b'),
+    _entity_re.compile(r'\b([A-Z]{2,5})\b')  # Stock symbols
+]
+
+_FINANCIAL_PATTERNS = [
+    _entity_re.compile(r'(\$[\d,]+(?:\.\d{2})?)'),  # Dollar amounts
+    _entity_re.compile(r'([\d,]+(?:\.\d{2})?%)'),   # Percentages
+    _entity_re.compile(r'(\d+(?:\.\d+)?\s*(?:billion|million|trillion))'),  # Large numbers
+]
+
+_DATE_PATTERNS = [_entity_re.compile('(?i)' + p) for p in (
+    r'(\d{1,2}/\d{1,2}/\d{4})',
+    r'(\d{4}-\d{2}-\d{2})',
+    r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})'
+)]
+
+# Patterns used by FinancialEntityExtractor, keyed by entity type
+_ENTITY_PATTERNS = {
+    'stock_symbol': r'\b[A-Z]{1,5}\b',
+    'currency': r'\b(?:USD|EUR|GBP|JPY|INR|CNY)\b',
+    'percentage': r'\d+(?:\.\d+)?%',
+    'dollar_amount': r'\$[\d,]+(?:\.\d{2})?',
+    'market_cap': r'\d+(?:\.\d+)?\s*(?:billion|million|trillion)',
+    'date': r'\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}',
+    'company_name': r'\b[A-Z][a-z]+\s+(?:Inc\.|Corp\.|Ltd\.|Company)\b'
+}
+
+# Alternation order for the fused pattern: where two types could match at the
+# same position the more specific one wins, so the catch-all stock_symbol goes last
+_ENTITY_PRECEDENCE = (
+    'company_name', 'currency', 'date', 'dollar_amount',
+    'market_cap', 'percentage', 'stock_symbol'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _combined_entity_pattern(entity_types: frozenset):
+    """Fuse the given entity patterns into one alternation of named groups."""
+    return _entity_re.compile('|'.join(
+        f'(?P<{name}>{_ENTITY_PATTERNS[name]})'
+        for name in _ENTITY_PRECEDENCE if name in entity_types
+    ))
+
+
+def _build_keyword_automaton(keyword_groups: Dict[str, List[str]]):
+    """Build an Aho-Corasick automaton tagging each keyword with its categories."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    categories_by_word = {}
+    for category, words in keyword_groups.items():
+        for word in words:
+            categories_by_word.setdefault(word, []).append(category)
+    
+    automaton = ahocorasick.Automaton()
+    for word, categories in categories_by_word.items():
+        automaton.add_word(word, (word, tuple(categories)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_keywords(automaton, text_lower: str, categories) -> Dict[str, int]:
+    """Count keyword hits per category in a single pass over the text."""
+    counts = dict.fromkeys(categories, 0)
+    for _, (_, word_categories) in automaton.iter(text_lower):
+        for category in word_categories:
+            counts[category] += 1
+    return counts
+
 
 class DocumentType(Enum):
     """Document type classifications."""
@@ -79,21 +169,40 @@ class MockLLMService:
                 'Interest rate changes affecting market sentiment'
             ]
         }
+        
+        # Define classification keywords
+        self.classification_keywords = {
+            'financial_report': ['financial', 'earnings', 'revenue', 'profit', 'balance sheet'],
+            'market_analysis': ['market', 'analysis', 'trend', 'forecast', 'outlook'],
+            'news_article': ['news', 'breaking', 'reported', 'announced', 'today'],
+            'research_report': ['research', 'study', 'analysis', 'recommendation', 'rating'],
+            'earnings_report': ['earnings', 'quarterly', 'eps', 'guidance', 'results']
+        }
+        
+        # Keywords behind each insight, checked in this order by generate_insights
+        self.insight_keywords = {
+            'direction_positive': ['growth', 'increase', 'rise', 'up'],
+            'direction_negative': ['decline', 'decrease', 'fall', 'down'],
+            'volatility_high': ['volatile', 'uncertainty', 'risk'],
+            'volatility_low': ['stable', 'steady', 'consistent'],
+            'sectors': ['technology', 'healthcare', 'finance', 'energy', 'retail'],
+            'horizon_short': ['short-term', 'immediate', 'near-term'],
+            'horizon_long': ['long-term', 'future', 'years']
+        }
+        
+        # One automaton per keyword set, so each analysis is a single scan of the text
+        self._sentiment_ac = _build_keyword_automaton(self.response_templates['sentiment_analysis'])
+        self._classify_ac = _build_keyword_automaton(self.classification_keywords)
+        self._insights_ac = _build_keyword_automaton(self.insight_keywords)
     
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """Extract financial entities from text using pattern matching."""
         try:
             entities = []
-            text_lower = text.lower()
             
             # Extract companies (simple pattern matching)
-            company_patterns = [
-                r'\b([A-Z][a-z]+ (?:Inc\.|Corp\.|Ltd\.|Company))\b',
-                r'\b([A-Z]{2,5})\b'  # Stock symbols
-            ]
-            
-            for pattern in company_patterns:
-                matches = re.findall(pattern, text)
+            for pattern in _COMPANY_PATTERNS:
+                matches = pattern.findall(text)
                 for match in matches:
                     entities.append({
                         'type': 'company',
@@ -102,14 +211,8 @@ class MockLLMService:
                     })
             
             # Extract financial metrics
-            financial_patterns = [
-                r'(\$[\d,]+(?:\.\d{2})?)',  # Dollar amounts
-                r'([\d,]+(?:\.\d{2})?%)',   # Percentages
-                r'(\d+(?:\.\d+)?\s*(?:billion|million|trillion))',  # Large numbers
-            ]
-            
-            for pattern in financial_patterns:
-                matches = re.findall(pattern, text)
+            for pattern in _FINANCIAL_PATTERNS:
+                matches = pattern.findall(text)
                 for match in matches:
                     entities.append({
                         'type': 'financial_metric',
@@ -118,14 +221,8 @@ class MockLLMService:
                     })
             
             # Extract dates
-            date_patterns = [
-                r'(\d{1,2}/\d{1,2}/\d{4})',
-                r'(\d{4}-\d{2}-\d{2})',
-                r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})'
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+            for pattern in _DATE_PATTERNS:
+                matches = pattern.findall(text)
                 for match in matches:
                     entities.append({
                         'type': 'date',
@@ -138,26 +235,35 @@ class MockLLMService:
         except Exception as e:
             return []
     
-    def analyze_sentiment(self, text: str) -> Dict[str, float]:
+    def analyze_sentiment(self, text: str, text_lower: str = None) -> Dict[str, float]:
         """Analyze sentiment of text using keyword matching."""
         try:
-            text_lower = text.lower()
-            
-            positive_score = 0
-            negative_score = 0
-            neutral_score = 0
-            
-            # Count positive keywords
-            for word in self.response_templates['sentiment_analysis']['positive']:
-                positive_score += text_lower.count(word)
+            if text_lower is None:
+                text_lower = text.lower()
             
-            # Count negative keywords
-            for word in self.response_templates['sentiment_analysis']['negative']:
-                negative_score += text_lower.count(word)
+            sentiment_keywords = self.response_templates['sentiment_analysis']
             
-            # Count neutral keywords
-            for word in self.response_templates['sentiment_analysis']['neutral']:
-                neutral_score += text_lower.count(word)
+            if self._sentiment_ac is not None:
+                counts = _count_keywords(self._sentiment_ac, text_lower, sentiment_keywords)
+                positive_score = counts['positive']
+                negative_score = counts['negative']
+                neutral_score = counts['neutral']
+            else:
+                positive_score = 0
+                negative_score = 0
+                neutral_score = 0
+                
+                # Count positive keywords
+                for word in sentiment_keywords['positive']:
+                    positive_score += text_lower.count(word)
+                
+                # Count negative keywords
+                for word in sentiment_keywords['negative']:
+                    negative_score += text_lower.count(word)
+                
+                # Count neutral keywords
+                for word in sentiment_keywords['neutral']:
+                    neutral_score += text_lower.count(word)
             
             # Normalize scores
             total = positive_score + negative_score + neutral_score
@@ -173,24 +279,19 @@ class MockLLMService:
         except Exception as e:
             return {'positive': 0.33, 'negative': 0.33, 'neutral': 0.34}
     
-    def classify_document(self, text: str) -> Tuple[str, float]:
+    def classify_document(self, text: str, text_lower: str = None) -> Tuple[str, float]:
         """Classify document type based on content."""
         try:
-            text_lower = text.lower()
+            if text_lower is None:
+                text_lower = text.lower()
             
-            # Define classification keywords
-            classification_keywords = {
-                'financial_report': ['financial', 'earnings', 'revenue', 'profit', 'balance sheet'],
-                'market_analysis': ['market', 'analysis', 'trend', 'forecast', 'outlook'],
-                'news_article': ['news', 'breaking', 'reported', 'announced', 'today'],
-                'research_report': ['research', 'study', 'analysis', 'recommendation', 'rating'],
-                'earnings_report': ['earnings', 'quarterly', 'eps', 'guidance', 'results']
-            }
-            
-            scores = {}
-            for doc_type, keywords in classification_keywords.items():
-                score = sum(text_lower.count(keyword) for keyword in keywords)
-                scores[doc_type] = score
+            if self._classify_ac is not None:
+                scores = _count_keywords(self._classify_ac, text_lower, self.classification_keywords)
+            else:
+                scores = {}
+                for doc_type, keywords in self.classification_keywords.items():
+                    score = sum(text_lower.count(keyword) for keyword in keywords)
+                    scores[doc_type] = score
             
             if not scores or max(scores.values()) == 0:
                 return DocumentType.UNKNOWN.value, 0.5
@@ -203,40 +304,49 @@ class MockLLMService:
         except Exception as e:
             return DocumentType.UNKNOWN.value, 0.5
     
-    def generate_insights(self, text: str, entities: List[Dict]) -> Dict[str, Any]:
+    def generate_insights(self, text: str, entities: List[Dict],
+                          text_lower: str = None) -> Dict[str, Any]:
         """Generate market insights from text and entities."""
         try:
             insights = {}
             
             # Extract key themes
-            text_lower = text.lower()
+            if text_lower is None:
+                text_lower = text.lower()
+            keywords = self.insight_keywords
+            
+            # Keywords present in the text, found in one pass when the automaton is available
+            if self._insights_ac is not None:
+                found = {word for _, (word, _) in self._insights_ac.iter(text_lower)}
+                present = found.__contains__
+            else:
+                present = text_lower.__contains__
             
             # Market direction insights
-            if any(word in text_lower for word in ['growth', 'increase', 'rise', 'up']):
+            if any(present(word) for word in keywords['direction_positive']):
                 insights['market_direction'] = 'positive'
-            elif any(word in text_lower for word in ['decline', 'decrease', 'fall', 'down']):
+            elif any(present(word) for word in keywords['direction_negative']):
                 insights['market_direction'] = 'negative'
             else:
                 insights['market_direction'] = 'neutral'
             
             # Volatility insights
-            if any(word in text_lower for word in ['volatile', 'uncertainty', 'risk']):
+            if any(present(word) for word in keywords['volatility_high']):
                 insights['volatility_outlook'] = 'high'
-            elif any(word in text_lower for word in ['stable', 'steady', 'consistent']):
+            elif any(present(word) for word in keywords['volatility_low']):
                 insights['volatility_outlook'] = 'low'
             else:
                 insights['volatility_outlook'] = 'moderate'
             
             # Sector insights
-            sectors = ['technology', 'healthcare', 'finance', 'energy', 'retail']
-            mentioned_sectors = [sector for sector in sectors if sector in text_lower]
+            mentioned_sectors = [sector for sector in keywords['sectors'] if present(sector)]
             if mentioned_sectors:
                 insights['relevant_sectors'] = mentioned_sectors
             
             # Time horizon
-            if any(word in text_lower for word in ['short-term', 'immediate', 'near-term']):
+            if any(present(word) for word in keywords['horizon_short']):
                 insights['time_horizon'] = 'short-term'
-            elif any(word in text_lower for word in ['long-term', 'future', 'years']):
+            elif any(present(word) for word in keywords['horizon_long']):
                 insights['time_horizon'] = 'long-term'
             else:
                 insights['time_horizon'] = 'medium-term'
@@ -274,20 +384,21 @@ class AWSBedrockService:
         # In production, this would call AWS Bedrock API
         return self.mock_service.extract_entities(text)
     
-    def analyze_sentiment(self, text: str) -> Dict[str, float]:
+    def analyze_sentiment(self, text: str, text_lower: str = None) -> Dict[str, float]:
         """Analyze sentiment using AWS Bedrock (fallback to mock)."""
         # In production, this would call AWS Bedrock API
-        return self.mock_service.analyze_sentiment(text)
+        return self.mock_service.analyze_sentiment(text, text_lower)
     
-    def classify_document(self, text: str) -> Tuple[str, float]:
+    def classify_document(self, text: str, text_lower: str = None) -> Tuple[str, float]:
         """Classify document using AWS Bedrock (fallback to mock)."""
         # In production, this would call AWS Bedrock API
-        return self.mock_service.classify_document(text)
+        return self.mock_service.classify_document(text, text_lower)
     
-    def generate_insights(self, text: str, entities: List[Dict]) -> Dict[str, Any]:
+    def generate_insights(self, text: str, entities: List[Dict],
+                          text_lower: str = None) -> Dict[str, Any]:
         """Generate insights using AWS Bedrock (fallback to mock)."""
         # In production, this would call AWS Bedrock API
-        return self.mock_service.generate_insights(text, entities)
+        return self.mock_service.generate_insights(text, entities, text_lower)
 
 
 class LLMService:
@@ -311,24 +422,25 @@ class LLMService:
         except Exception as e:
             raise LLMServiceError(f"Entity extraction failed: {str(e)}")
     
-    def analyze_sentiment(self, text: str) -> Dict[str, float]:
+    def analyze_sentiment(self, text: str, text_lower: str = None) -> Dict[str, float]:
         """Analyze sentiment of text."""
         try:
-            return self.service.analyze_sentiment(text)
+            return self.service.analyze_sentiment(text, text_lower)
         except Exception as e:
             raise LLMServiceError(f"Sentiment analysis failed: {str(e)}")
     
-    def classify_document(self, text: str) -> Tuple[str, float]:
+    def classify_document(self, text: str, text_lower: str = None) -> Tuple[str, float]:
         """Classify document type."""
         try:
-            return self.service.classify_document(text)
+            return self.service.classify_document(text, text_lower)
         except Exception as e:
             raise LLMServiceError(f"Document classification failed: {str(e)}")
     
-    def generate_insights(self, text: str, entities: List[Dict]) -> Dict[str, Any]:
+    def generate_insights(self, text: str, entities: List[Dict],
+                          text_lower: str = None) -> Dict[str, Any]:
         """Generate market insights."""
         try:
-            return self.service.generate_insights(text, entities)
+            return self.service.generate_insights(text, entities, text_lower)
         except Exception as e:
             raise LLMServiceError(f"Insight generation failed: {str(e)}")
 
@@ -339,46 +451,40 @@ class FinancialEntityExtractor:
     def __init__(self):
         """Initialize entity extractor."""
         self.entity_patterns = {
-            'stock_symbol': r'\b[A-Z]{1,5}\b',
-            'currency': r'\b(?:USD|EUR|GBP|JPY|INR|CNY)\b',
-            'percentage': r'\d+(?:\.\d+)?%',
-            'dollar_amount': r'\$[\d,]+(?:\.\d{2})?',
-            'market_cap': r'\d+(?:\.\d+)?\s*(?:billion|million|trillion)',
-            'date': r'\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}',
-            'company_name': r'\b[A-Z][a-z]+\s+(?:Inc\.|Corp\.|Ltd\.|Company)\b'
+            name: _entity_re.compile(pattern) for name, pattern in _ENTITY_PATTERNS.items()
         }
+        self._combined = _combined_entity_pattern(frozenset(self.entity_patterns))
+    
+    def _scan(self, pattern, text: str) -> List[Dict[str, Any]]:
+        """Single finditer pass over text, typing each match by its named group."""
+        if not RE2_AVAILABLE:
+            return [
+                {'type': m.lastgroup, 'value': m.group(), 'confidence': 0.8}
+                for m in pattern.finditer(text)
+            ]
+        
+        # RE2 matches don't offer lastgroup, so look for the named group that took part
+        groups = sorted((index, name) for name, index in pattern.groupindex.items())
+        return [
+            {
+                'type': next(name for index, name in groups if m.group(index) is not None),
+                'value': m.group(),
+                'confidence': 0.8
+            }
+            for m in pattern.finditer(text)
+        ]
     
     def extract_all_entities(self, text: str) -> List[Dict[str, Any]]:
         """Extract all financial entities from text."""
-        entities = []
-        
-        for entity_type, pattern in self.entity_patterns.items():
-            matches = re.findall(pattern, text)
-            for match in matches:
-                entities.append({
-                    'type': entity_type,
-                    'value': match,
-                    'confidence': 0.8
-                })
-        
-        return entities
+        return self._scan(self._combined, text)
     
     def extract_specific_entities(self, text: str, entity_types: List[str]) -> List[Dict[str, Any]]:
         """Extract specific types of entities."""
-        entities = []
-        
-        for entity_type in entity_types:
-            if entity_type in self.entity_patterns:
-                pattern = self.entity_patterns[entity_type]
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    entities.append({
-                        'type': entity_type,
-                        'value': match,
-                        'confidence': 0.8
-                    })
+        requested = frozenset(entity_types).intersection(self.entity_patterns)
+        if not requested:
+            return []
         
-        return entities
+        return self._scan(_combined_entity_pattern(requested), text)
 
 
 class DocumentParser:
@@ -408,17 +514,20 @@ class DocumentParser:
             if not text.strip():
                 raise DocumentParsingError("Document is empty")
             
+            # Lowercase once and share it across the keyword-based analyses
+            text_lower = text.lower()
+            
             # Extract entities
             entities = self.llm_service.extract_entities(text)
             
             # Classify document
-            doc_type, type_confidence = self.llm_service.classify_document(text)
+            doc_type, type_confidence = self.llm_service.classify_document(text, text_lower)
             
             # Analyze sentiment
-            sentiment = self.llm_service.analyze_sentiment(text)
+            sentiment = self.llm_service.analyze_sentiment(text, text_lower)
             
             # Generate insights
-            insights = self.llm_service.generate_insights(text, entities)
+            insights = self.llm_service.generate_insights(text, entities, text_lower)
             
             # Calculate confidence scores
             confidence_scores = {
@@ -452,24 +561,18 @@ class DocumentParser:
     def extract_financial_entities(self, text: str) -> List[Dict[str, Any]]:
         """Extract financial entities from text."""
         try:
-            # Use both LLM service and pattern-based extraction
+            # Use both LLM service and pattern-based extraction; the LLM pass is the
+            # only source of company/financial_metric entities and month-name dates
             llm_entities = self.llm_service.extract_entities(text)
             pattern_entities = self.entity_extractor.extract_all_entities(text)
-            
-            # Combine and deduplicate entities
             all_entities = llm_entities + pattern_entities
             
-            # Simple deduplication based on value
-            seen_values = set()
-            unique_entities = []
-            
+            # Simple deduplication based on value, keeping the first occurrence
+            unique_entities = {}
             for entity in all_entities:
-                value = entity.get('value', '').lower()
-                if value not in seen_values:
-                    seen_values.add(value)
-                    unique_entities.append(entity)
+                unique_entities.setdefault(entity.get('value', '').lower(), entity)
             
-            return unique_entities
+            return list(unique_entities.values())
             
         except Exception as e:
             raise DocumentParsingError(f"Entity extraction failed: {str(e)}")
@@ -495,33 +598,51 @@ class DocumentParser:
         """Get previously processed document analysis."""
         return self.processed_documents.get(document_id)
     
+    def store_processed_document(self, analysis: DocumentAnalysis) -> None:
+        """Record an analysis produced elsewhere (e.g. in a worker process)."""
+        self.processed_documents[analysis.document_id] = analysis
+    
     def get_all_processed_documents(self) -> Dict[str, DocumentAnalysis]:
         """Get all processed documents."""
         return self.processed_documents.copy()
     
+    def _analyze_one(self, doc: Dict[str, str]) -> Tuple[DocumentAnalysis, bool]:
+        """Parse one batch entry, returning (analysis, parsed) with an error result on failure."""
+        try:
+            analysis = self.parse_document(
+                document_path=doc.get('path'),
+                text_content=doc.get('content'),
+                document_id=doc.get('id')
+            )
+            return analysis, True
+        except Exception as e:
+            # Create error result
+            error_analysis = DocumentAnalysis(
+                document_id=doc.get('id', 'unknown'),
+                document_type=DocumentType.UNKNOWN.value,
+                extracted_entities=[],
+                market_insights={'error': str(e)},
+                confidence_scores={'error': 0.0},
+                processing_timestamp=datetime.now()
+            )
+            return error_analysis, False
+    
     def analyze_multiple_documents(self, documents: List[Dict[str, str]]) -> List[DocumentAnalysis]:
         """Analyze multiple documents in batch."""
-        results = []
+        # Small batches aren't worth the cost of starting worker processes
+        if len(documents) < _PARALLEL_BATCH_MIN:
+            return [self._analyze_one(doc)[0] for doc in documents]
+        
+        # Documents are independent, so spread them across worker processes
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker,
+                                 initargs=(self.llm_service.service_type,)) as executor:
+            outcomes = list(executor.map(_parse_one, documents))
         
-        for doc in documents:
-            try:
-                analysis = self.parse_document(
-                    document_path=doc.get('path'),
-                    text_content=doc.get('content'),
-                    document_id=doc.get('id')
-                )
-                results.append(analysis)
-            except Exception as e:
-                # Create error result
-                error_analysis = DocumentAnalysis(
-                    document_id=doc.get('id', 'unknown'),
-                    document_type=DocumentType.UNKNOWN.value,
-                    extracted_entities=[],
-                    market_insights={'error': str(e)},
-                    confidence_scores={'error': 0.0},
-                    processing_timestamp=datetime.now()
-                )
-                results.append(error_analysis)
+        results = []
+        for analysis, parsed in outcomes:
+            if parsed:
+                self.store_processed_document(analysis)
+            results.append(analysis)
         
         return results
     
@@ -533,4 +654,22 @@ class DocumentParser:
             'max_tokens': getattr(self.llm_service.service, 'max_tokens', 0),
             'processed_documents': len(self.processed_documents),
             'available_entity_types': list(self.entity_extractor.entity_patterns.keys())
-        }
\ No newline at end of file
+        }
+
+
+# Batches smaller than this are parsed in the calling process
+_PARALLEL_BATCH_MIN = 8
+
+# Parser owned by each analyze_multiple_documents worker process
+_worker_parser = None
+
+
+def _init_worker(llm_service_type: str) -> None:
+    """Create the worker's DocumentParser once, when the pool process starts."""
+    global _worker_parser
+    _worker_parser = DocumentParser(llm_service_type)
+
+
+def _parse_one(doc: Dict[str, str]) -> Tuple[DocumentAnalysis, bool]:
+    """Parse one batch entry in a pool worker."""
+    return _worker_parser._analyze_one(doc)
@@ -463,7 +463,22 @@ class PriceForecastingEngine:
             
         except Exception as e:
             raise ForecastingError(f"Failed to generate predictions: {str(e)}")
-    
+
+    def predict_prices_batch(self, requests: List[Tuple[str, Optional[int], str]]
+                             ) -> List[Union[ForecastResult, ForecastingError]]:
+        """Generate predictions for several (symbol, horizon, model_name) requests.
+
+        Failures are returned in place of the result so one bad request does
+        not fail the rest of the batch.
+        """
+        results = []
+        for symbol, horizon, model_name in requests:
+            try:
+                results.append(self.predict_prices(symbol, horizon, model_name))
+            except ForecastingError as e:
+                results.append(e)
+        return results
+
     def get_confidence_intervals(self, predictions: List[float], 
                                confidence_level: float = None) -> Tuple[List[float], List[float]]:
         """Calculate confidence intervals for predictions."""
@@ -405,7 +405,11 @@ class MarketCopilot:
         except Exception as e:
             error_response = f"I apologize, but I encountered an error processing your query: {str(e)}"
             return error_response
-    
+
+    def process_queries_batch(self, queries: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[str]:
+        """Process several (query, context) pairs in one call, preserving order."""
+        return [self.process_query(query, context) for query, context in queries]
+
     def _is_pricing_query(self, query: str) -> bool:
         """Check if query is related to competitive pricing."""
         pricing_keywords = [
@@ -2,7 +2,7 @@
 
 import math
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -528,8 +528,14 @@ class PricingEngine:
         except Exception as e:
             return {'error': f'Failed to generate insights: {str(e)}'}
     
-    def update_price_history(self, symbol: str, prices: List[float]):
-        """Update price history for a symbol."""
+    def update_price_history(self, symbol: str, prices: Union['np.ndarray', List[float]]):
+        """Update price history for a symbol.
+        
+        Arrays (e.g. ``df['close'].to_numpy(copy=False)``) are stored without
+        being boxed into a Python list.
+        """
+        if PANDAS_AVAILABLE:
+            prices = np.asarray(prices, dtype=np.float64)
         self.price_history[symbol] = prices
     
     def get_available_symbols(self) -> List[str]:
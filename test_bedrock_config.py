@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Test Bedrock Model Configuration
+================================
+
+Verify that model configurations survive copying and pickling.
+"""
+
+import copy
+import pickle
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.bedrock_config import BedrockModel, get_model_registry
+
+
+def test_model_configuration_round_trip():
+    """deepcopy and pickle both reproduce an equal configuration, derived slot included."""
+    config = get_model_registry().get_model_config(BedrockModel.CLAUDE_3_SONNET)
+
+    for restored in (copy.copy(config), copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+        assert restored == config
+        assert restored.cost_per_token == config.cost_per_token
+
+
+if __name__ == "__main__":
+    test_model_configuration_round_trip()
+    print("✅ ModelConfiguration copies and pickles")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test Document Entities
+======================
+
+Verify that entity extraction keeps the LLM-derived entity types that
+market insights are built from.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.document_parser import DocumentParser
+
+
+SAMPLE_TEXT = (
+    "Acme Company reported revenue of $1,250.50 on March 5, 2024, "
+    "with margins up 12.50% and a market cap of 3 billion."
+)
+
+
+def test_financial_entities_keep_llm_types():
+    """Company, financial metric and month-name date entities survive deduplication."""
+    parser = DocumentParser("mock-llm")
+    entities = parser.extract_financial_entities(SAMPLE_TEXT)
+    by_value = {entity['value']: entity['type'] for entity in entities}
+
+    assert by_value['Acme Company'] == 'company'
+    assert by_value['$1,250.50'] == 'financial_metric'
+    assert by_value['March 5, 2024'] == 'date'
+
+
+def test_market_insights_list_companies_and_metrics():
+    """Insights built from the extracted entities name the companies and metrics."""
+    parser = DocumentParser("mock-llm")
+    insights = parser.extract_market_insights(SAMPLE_TEXT)
+
+    assert 'Acme Company' in insights['mentioned_companies']
+    assert '$1,250.50' in insights['financial_metrics']
+    assert '12.50%' in insights['financial_metrics']
+
+
+if __name__ == "__main__":
+    test_financial_entities_keep_llm_types()
+    test_market_insights_list_companies_and_metrics()
+    print("✅ Document entity types preserved")
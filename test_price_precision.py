@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test Price Precision
+====================
+
+Verify that prices loaded from CSV keep their exact two-decimal values.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.data_loader import DataLoader
+
+
+CSV_ROWS = [
+    ('2024-01-01', 160100.10, 160700.55, 159900.05, 160579.29, 1200),
+    ('2024-01-02', 157100.00, 157300.00, 156800.40, 157050.74, 1500),
+    ('2024-01-03', 157050.74, 158200.99, 156950.01, 158123.45, 1100),
+]
+
+
+def test_close_prices_round_trip(tmp_path):
+    """Close prices come back exactly as written, with and without the Parquet cache."""
+    lines = ['date,open,high,low,close,volume']
+    lines += [','.join(str(value) for value in row) for row in CSV_ROWS]
+    (tmp_path / 'gold_prices.csv').write_text('\n'.join(lines) + '\n')
+
+    expected = [row[4] for row in CSV_ROWS]
+    loader = DataLoader(data_dir=str(tmp_path))
+
+    # First load parses the CSV, the second may be served from the cache
+    for _ in range(2):
+        df = loader.load_gold_prices()
+        assert df['close'].tolist() == expected
+        assert df['close'].dtype.name == 'float64'
+
+
+if __name__ == "__main__":
+    import tempfile
+    import pathlib
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_close_prices_round_trip(pathlib.Path(tmp))
+    print("✅ Close prices round-trip exactly")